@@ -1,136 +1,372 @@
-from google import genai
-from google.genai import types
-from dotenv import load_dotenv
+from pathlib import Path
+from typing import List, Optional
+import asyncio
+import functools
+import hashlib
+import inspect
 import os
+import re
+import sqlite3
+import sys
 
-load_dotenv()
-
-api_key = os.environ.get("GOOGLE_API_KEY") 
-
-if not api_key:
-    api_key = os.environ.get("GEMINI_API_KEY")
-
-if not api_key:
-    raise ValueError("API key not found. Please set GOOGLE_API_KEY or GEMINI_API_KEY in your .env file.")
-
-client = genai.Client(api_key=api_key)
-
-# --- System Instruction: Defines the AI's role, rules, and reference template ---
-system_instruction = """
-You are a network topology assistant. Your task is to generate a new network topology in JSON format. This JSON file will be parsed by a custom Python script that defines a specific schema.
-
-You must follow the schema rules outlined below. You must also use the "Full Schema Template" as a reference for the structure. You must only output the raw JSON, with no other text, comments, or explanations.
-
-### Schema Rules
-
-1.  **Top-Level Keys:**
-    * `ID`: (String) A unique, simple identifier for the topology (e.g., "MyTestNet").
-    * `VERSION`: (String) The topology version (e.g., "1.0").
-    * `DESCRIPTION`: (String) A brief description of the topology.
-
-2.  **`MONITORING` Block (Optional):**
-    * This block controls the `IntentMonitor`.
-    * `enabled`: (Boolean) `true` to run the monitor, `false` to disable.
-    * `interval`: (Number) The time in seconds between monitoring checks.
-    * `recovery_enabled`: (Boolean) `true` to allow the monitor to attempt recovery actions, `false` to only report issues.
-
-3.  **`COMPONENTS` Block:**
-    * This block defines all network devices.
-    * **`HOSTS`:** (List)
-        * `ID`: (String) Host identifier (e.g., "h1").
-        * `IP`: (String, Optional) IP address with subnet (e.g., "10.0.0.1/24").
-        * `MAC`: (String, Optional) MAC address.
-        * `MAX_CPU`: (Number, Optional) Creates a CPU Intent. A float from 0.0 to 1.0 (e.g., 0.8 for 80%).
-        * `MAX_RAM`: (Number, Optional) Creates a Memory Intent. An integer for max RAM in MB (e.g., 512).
-    * **`SWITCHES`:** (List)
-        * `ID`: (String) Switch identifier (e.g., "s1").
-        * `TYPE`: (String, Optional) The class to use (e.g., "OVSSwitch", "OVSKernelSwitch").
-        * `PARAMS`: (Object, Optional) Parameters for the switch (e.g., `{"PROTOCOLS": "OpenFlow13"}`).
-    * **`CONTROLLERS`:** (List)
-        * `ID`: (String) Controller identifier (e.g., "c0").
-        * `TYPE`: (String, Optional) The class to use (e.g., "RemoteController").
-        * `PARAMS`: (Object, Optional) Parameters (e.g., `{"IP": "127.0.0.1", "PORT": 6653}`).
-
-4.  **`CONNECTIONS` Block:**
-    * This block defines the links between components.
-    * `ENDPOINTS`: (List) A list of two `ID` strings to link (e.g., `["h1", "s1"]`).
-    * `PARAMS` (Optional): This object creates Link Intents.
-        * `BANDWIDTH`: (Number) Link speed limit in Mbps (e.g., 100).
-        * `DELAY`: (String) Link delay (e.g., "5ms", "100us").
-        * `LOSS`: (Number) Packet loss percentage (e.g., 1 for 1%).
-
----
-### Full Schema Template JSON (for reference)
-```json
-{
-  "ID": "my_new_topology",
-  "VERSION": "1.0",
-  "DESCRIPTION": "A description of the new topology.",
-  "MONITORING": {
-    "enabled": true,
-    "interval": 10,
-    "recovery_enabled": true
-  },
-  "COMPONENTS": {
-    "HOSTS": [
-      {
-        "ID": "h1",
-        "IP": "10.0.0.1/24",
-        "MAC": "00:00:00:00:00:01",
-        "MAX_CPU": 0.5,
-        "MAX_RAM": 256
-      },
-      {
-        "ID": "h2",
-        "IP": "10.0.0.2/24"
-      }
-    ],
-    "SWITCHES": [
-      {
-        "ID": "s1",
-        "TYPE": "OVSSwitch",
-        "PARAMS": {
-          "PROTOCOLS": "OpenFlow13"
-        }
-      }
-    ],
-    "CONTROLLERS": [
-      {
-        "ID": "c0",
-        "TYPE": "RemoteController",
-        "PARAMS": {
-          "IP": "127.0.0.1",
-          "PORT": 6653
-        }
-      }
-    ]
-  },
-  "CONNECTIONS": [
-    {
-      "ENDPOINTS": ["h1", "s1"],
-      "PARAMS": {
-        "BANDWIDTH": 100,
-        "DELAY": "5ms",
-        "LOSS": 1
-      }
-    },
-    {
-      "ENDPOINTS": ["h2", "s1"],
-      "PARAMS": {
-        "BANDWIDTH": 50
-      }
-    }
-  ]
-}
+# --- Response schema: Gemini's structured output constrains generation to these models ---
+# The field descriptions are sent with the schema and replace the prose rules
+# that used to be part of the system instruction. Built on first use: pydantic
+# is only needed to call the API or validate its answer, never for a cache hit
+@functools.cache
+def topology_model():
+    from pydantic import BaseModel, Field
+
+    class Monitoring(BaseModel):
+        enabled: bool = Field(description="true to run the IntentMonitor, false to disable it.")
+        interval: float = Field(description="Seconds between monitoring checks.")
+        recovery_enabled: bool = Field(description="true to let the monitor attempt recovery actions, false to only report issues.")
+
+    class Host(BaseModel):
+        ID: str = Field(description='Host identifier, e.g. "h1".')
+        IP: Optional[str] = Field(None, description='IP address with subnet, e.g. "10.0.0.1/24".')
+        MAC: Optional[str] = Field(None, description="MAC address.")
+        MAX_CPU: Optional[float] = Field(None, description="Creates a CPU intent: CPU fraction from 0.0 to 1.0, e.g. 0.8 for 80%.")
+        MAX_RAM: Optional[int] = Field(None, description="Creates a memory intent: maximum RAM in MB, e.g. 512.")
+
+    class SwitchParams(BaseModel):
+        PROTOCOLS: Optional[str] = Field(None, description='OpenFlow version, e.g. "OpenFlow13".')
+
+    class Switch(BaseModel):
+        ID: str = Field(description='Switch identifier, e.g. "s1".')
+        TYPE: Optional[str] = Field(None, description='Switch class, e.g. "OVSSwitch" or "OVSKernelSwitch".')
+        PARAMS: Optional[SwitchParams] = None
+
+    class ControllerParams(BaseModel):
+        IP: Optional[str] = Field(None, description='Controller address, e.g. "127.0.0.1".')
+        PORT: Optional[int] = Field(None, description="Controller port, e.g. 6653.")
+
+    class Controller(BaseModel):
+        ID: str = Field(description='Controller identifier, e.g. "c0".')
+        TYPE: Optional[str] = Field(None, description='Controller class, e.g. "RemoteController".')
+        PARAMS: Optional[ControllerParams] = None
+
+    class Components(BaseModel):
+        HOSTS: List[Host]
+        SWITCHES: List[Switch]
+        CONTROLLERS: List[Controller] = []
+
+    class LinkParams(BaseModel):
+        BANDWIDTH: Optional[float] = Field(None, description="Link speed limit in Mbps, e.g. 100.")
+        DELAY: Optional[str] = Field(None, description='Link delay, e.g. "5ms" or "100us".')
+        LOSS: Optional[float] = Field(None, description="Packet loss percentage, e.g. 1 for 1%.")
+
+    class Connection(BaseModel):
+        ENDPOINTS: List[str] = Field(description='The IDs of the two components to link, e.g. ["h1", "s1"].')
+        PARAMS: Optional[LinkParams] = Field(None, description="Creates link intents.")
+
+    class Topology(BaseModel):
+        ID: str = Field(description='A unique, simple identifier for the topology, e.g. "MyTestNet".')
+        VERSION: str = Field(description='The topology version, e.g. "1.0".')
+        DESCRIPTION: str = Field(description="A brief description of the topology.")
+        MONITORING: Optional[Monitoring] = None
+        COMPONENTS: Components
+        CONNECTIONS: List[Connection]
+
+    return Topology
+
+# Markdown code fence the model may still wrap around the JSON; group 1 is the payload
+FENCE_RE = re.compile(r"^\s*(?:```(?:json)?\s*)?(.*?)(?:\s*```)?\s*$", re.DOTALL)
+
+def normalize_topology(response_text):
+    # Validate against the schema and drop unset optional fields, which main.py
+    # expects to be absent rather than null. pydantic's ValidationError is a
+    # ValueError, which is what callers catch
+    payload = FENCE_RE.match(response_text).group(1)
+    return topology_model().model_validate_json(payload).model_dump_json(indent=2, exclude_none=True)
+
+# --- System Instruction: Defines the AI's role; the structure comes from the response schema ---
+# Keep this a fixed literal: nothing per-request (dates, IDs, user input) may be
+# interpolated into it. Every request then starts with the same bytes (system
+# instruction and schema, then the user prompt in `contents`), so the server can
+# reuse its cached prefix, and the response cache keys stay stable
+SYSTEM_INSTRUCTION = """
+You are a network topology assistant. Your task is to generate a new network topology, as JSON, for the network described by the user. Every ENDPOINTS entry must reference the ID of a host, switch or controller defined in COMPONENTS.
 """
 
-user_prompt = input("Enter your prompt here: ")
+MODEL = "gemini-2.5-flash"
+
+# Optional cheaper model raced against MODEL (e.g. "gemini-2.5-flash-lite"); unset disables it
+SPECULATIVE_MODEL = os.environ.get("GEMINI_SPECULATIVE_MODEL")
+
+def load_env_keys(names):
+    # Minimal .env reader for the few keys this script needs, instead of importing
+    # python-dotenv: KEY=VALUE lines, optional "export " prefix and quotes. Like
+    # load_dotenv(), variables already set in the environment are left alone
+    for env_path in (Path(".env"), Path(__file__).with_name(".env")):
+        if env_path.is_file():
+            break
+    else:
+        return
+
+    with open(env_path, encoding="utf-8") as env_file:
+        for line in env_file:
+            line = line.strip()
+            if line.startswith("export "):
+                line = line[len("export "):].lstrip()
+            name, sep, value = line.partition("=")
+            name = name.strip()
+            if sep and name in names and name not in os.environ:
+                os.environ[name] = value.strip().strip("\"'")
+
+@functools.cache
+def get_client():
+    # google.genai pulls in google.auth, httpx and friends; it is only imported
+    # once a prompt actually misses the cache and has to go to the API. Cached,
+    # so every caller in the process shares one client and its connection pool
+    from google import genai
+    from google.genai import types
+
+    environ = os.environ
+    api_key = environ.get("GOOGLE_API_KEY") or environ.get("GEMINI_API_KEY")
+
+    # The .env file is only read when the environment does not already hold a key
+    if not api_key:
+        load_env_keys(("GOOGLE_API_KEY", "GEMINI_API_KEY"))
+        api_key = environ.get("GOOGLE_API_KEY") or environ.get("GEMINI_API_KEY")
+
+    if not api_key:
+        raise ValueError("API key not found. Please set GOOGLE_API_KEY or GEMINI_API_KEY in your .env file.")
+
+    client = genai.Client(api_key=api_key)
+
+    # Built once and reused for every request
+    config = types.GenerateContentConfig(
+            system_instruction=SYSTEM_INSTRUCTION,
+            response_mime_type="application/json",
+            response_schema=topology_model()
+            )
+    return client, config
+
+# --- Response cache: repeated prompts are answered from disk, skipping the API call ---
+CACHE_PATH = Path(__file__).with_name("gemini_cache.sqlite3")
+
+@functools.cache
+def get_cache():
+    # Opened on first lookup, so importing this module creates no file
+    cache = sqlite3.connect(CACHE_PATH)
+    cache.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, prompt TEXT, response TEXT)")
+    return cache
+
+# In-process layer in front of SQLite, for prompts repeated within one run
+memory_cache = {}
+
+# Keys cover everything that shapes the answer besides the prompt: both models
+# (answers from either are stored under the same key), the system instruction
+# and the response schema, taken from the source of topology_model() so a cache
+# hit does not have to import pydantic. Changing any of them never serves
+# answers produced for the old request; that prefix is hashed once
+cache_key_prefix = hashlib.blake2b(
+        "\0".join((MODEL, SPECULATIVE_MODEL or "", SYSTEM_INSTRUCTION, inspect.getsource(topology_model), "")).encode("utf-8"),
+        digest_size=16)
+
+def cache_key(prompt):
+    # Only whitespace is collapsed: IDs in the prompt are case-sensitive in the
+    # generated topology, so "HostA" and "hosta" are different requests
+    normalized = " ".join(prompt.split())
+    hasher = cache_key_prefix.copy()
+    hasher.update(normalized.encode("utf-8"))
+    return hasher.hexdigest()
+
+def cached_response(key):
+    response_text = memory_cache.get(key)
+    if response_text is None:
+        row = get_cache().execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row:
+            response_text = memory_cache[key] = row[0]
+    return response_text
+
+def store_response(key, prompt, response_text):
+    memory_cache[key] = response_text
+    cache = get_cache()
+    cache.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, prompt, response_text))
+    cache.commit()
+
+class SpeculationFailed(Exception):
+    """Neither the speculative model nor MODEL produced a valid topology."""
+
+async def generate_speculative(client, config, prompt):
+    # Ask the cheap and the main model at once; the first answer that passes
+    # schema validation wins and the other request is cancelled
+    tasks = {
+        asyncio.create_task(client.aio.models.generate_content(model=model, config=config, contents=prompt)): model
+        for model in (SPECULATIVE_MODEL, MODEL)
+    }
+    pending = set(tasks)
+    errors = {}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Settle every finished task before returning, so a failure is always
+            # read (and reported) even when the other model's answer wins
+            answers = []
+            for task in done:
+                model = tasks[task]
+                error = task.exception()
+                if error is None:
+                    try:
+                        answers.append(normalize_topology(task.result().text))
+                        continue
+                    except ValueError as e:
+                        error = e
+                errors[model] = error
+                print(f"{model} did not produce a valid topology: {error}", file=sys.stderr)
+            if answers:
+                return answers[0]
+        raise SpeculationFailed(
+                f"Both {SPECULATIVE_MODEL} and {MODEL} failed: "
+                + "; ".join(f"{model}: {error}" for model, error in errors.items())
+                ) from errors.get(MODEL)
+    finally:
+        for task in pending:
+            task.cancel()
+        # Let the cancelled request finish unwinding; its outcome is not needed
+        await asyncio.gather(*pending, return_exceptions=True)
+
+async def generate(client, config, prompt):
+    # Stream the answer so output starts with the first chunk instead of
+    # after the whole generation; the full text is returned for the cache
+    if SPECULATIVE_MODEL:
+        # Two racing requests cannot both stream to the terminal; print the winner
+        try:
+            response_text = await generate_speculative(client, config, prompt)
+        except SpeculationFailed as e:
+            print(e, file=sys.stderr)
+            return None
+        print(response_text)
+        return response_text
+
+    parts = []
+    stream = await client.aio.models.generate_content_stream(
+            model=MODEL,
+            config=config,
+            contents=prompt
+            )
+    async for chunk in stream:
+        if chunk.text:
+            print(chunk.text, end="", flush=True)
+            parts.append(chunk.text)
+    print()
+    return "".join(parts)
+
+# Upper bound on requests in flight at once, to stay within the API rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+async def generate_many(client, config, prompts):
+    # All prompts are sent concurrently; results come back in prompt order
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def generate_one(prompt):
+        async with semaphore:
+            if SPECULATIVE_MODEL:
+                try:
+                    return await generate_speculative(client, config, prompt)
+                except SpeculationFailed as e:
+                    # Reported here; the prompt is left unanswered and uncached
+                    print(f"'{prompt}': {e}", file=sys.stderr)
+                    return None
+            try:
+                response = await client.aio.models.generate_content(
+                        model=MODEL,
+                        config=config,
+                        contents=prompt
+                        )
+            except Exception as e:
+                # One failed request (e.g. rate limited) must not discard the
+                # rest of the batch; this prompt is retried on the next run
+                print(f"'{prompt}': {MODEL} failed: {e}", file=sys.stderr)
+                return None
+            return response.text
+
+    return await asyncio.gather(*(generate_one(prompt) for prompt in prompts))
+
+def read_prompts(args):
+    # Each argument is a prompt, or a file with one prompt per line
+    prompts = []
+    for arg in args:
+        path = Path(arg)
+        if path.is_file():
+            prompts.extend(line.strip() for line in path.read_text().splitlines() if line.strip())
+        else:
+            prompts.append(arg)
+    return prompts
+
+def run_batch(args):
+    # Batch mode: python gemini_api_test.py "prompt" ... | prompts.txt
+    prompts = read_prompts(args)
+    keys = [cache_key(prompt) for prompt in prompts]
+    responses = {key: cached_response(key) for key in keys}
+
+    # Only prompts not answered by the cache go to the API, each once
+    missing = {key: prompt for key, prompt in zip(keys, prompts) if responses[key] is None}
+    if missing:
+        client, config = get_client()
+        results = asyncio.run(generate_many(client, config, list(missing.values())))
+        for key, response_text in zip(missing, results):
+            if response_text is None:
+                continue
+            try:
+                response_text = normalize_topology(response_text)
+            except ValueError as e:
+                # Shown as-is and not cached, so the prompt is retried next run
+                print(f"Response for '{missing[key]}' does not match the topology schema: {e}", file=sys.stderr)
+            else:
+                store_response(key, missing[key], response_text)
+            responses[key] = response_text
+
+    for prompt, key in zip(prompts, keys):
+        if responses[key] is not None:
+            print(f"### {prompt}\n{responses[key]}\n")
+
+async def repl():
+    # Interactive mode: one process answers prompts until Ctrl-D, so imports and
+    # the client (with its connection pool) are set up once for the whole session.
+    # A single event loop for the session keeps the async client usable across prompts
+    try:
+        import readline  # noqa: F401 -- line editing and history for input()
+    except ImportError:
+        pass
+
+    while True:
+        try:
+            user_prompt = input("Enter your prompt here: ")
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        if not user_prompt.strip():
+            continue
+
+        key = cache_key(user_prompt)
+        response_text = cached_response(key)
+        if response_text is not None:
+            print(response_text)
+            continue
+
+        try:
+            client, config = get_client()
+            response_text = await generate(client, config, user_prompt)
+        except Exception as e:
+            # A failed request (missing key, network, rate limit) ends only this prompt
+            print(f"Request failed: {e}", file=sys.stderr)
+            continue
+        if response_text is None:
+            continue
+        try:
+            store_response(key, user_prompt, normalize_topology(response_text))
+        except ValueError as e:
+            print(f"Response does not match the topology schema, not cached: {e}", file=sys.stderr)
 
-response = client.models.generate_content(
-        model="gemini-2.5-flash", 
-        config=types.GenerateContentConfig(
-            system_instruction=system_instruction),
-        contents=user_prompt
-        )
+def main():
+    if len(sys.argv) > 1:
+        run_batch(sys.argv[1:])
+    else:
+        asyncio.run(repl())
 
-print(response.text)
+# Importing the module (e.g. to share get_client()) runs nothing and opens no files
+if __name__ == "__main__":
+    main()
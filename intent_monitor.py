@@ -4,6 +4,8 @@ import time
 import json
 import re
 import os
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +13,33 @@ from pathlib import Path
 # We need the PluginManager and the MonitorRecoveryPlugin interface
 from main import PluginManager, MonitorRecoveryPlugin 
 
+# Upper bound on concurrent checks; each one mostly waits on a node's shell
+_MAX_CHECK_WORKERS = 32
+
+# Intents that keep passing are probed less often: after this many consecutive
+# OK results the gap between probes doubles each time, up to the cap (in cycles)
+_BACKOFF_AFTER_OK = 3
+_MAX_BACKOFF_CYCLES = 8
+# Intent types that fluctuate too much to back off; probed on every cycle
+_ALWAYS_PROBED = frozenset({'DELAY', 'PACKET_LOSS'})
+
+# Link parameter intents and the Mininet link option each one maps to
+_LINK_PARAM_OPTIONS = {'BANDWIDTH': 'bw', 'DELAY': 'delay', 'PACKET_LOSS': 'loss'}
+
+# Patterns used to parse probe output, compiled once for every check cycle
+_DELAY_THRESHOLD_RE = re.compile(r"(\d+(?:\.\d+)?)ms")
+_RTT_AVG_RE = re.compile(r'rtt .* = .*?/([\d.]+)/.* ms')
+_PACKET_LOSS_RE = re.compile(r'(\d+)% packet loss')
+# fping -q summary line, e.g. "10.0.0.2 : xmt/rcv/%loss = 1/1/0%, min/avg/max = ..."
+_FPING_RESULT_RE = re.compile(r'^(\S+)\s*: xmt/rcv/%loss = \d+/\d+/(\d+)%', re.MULTILINE)
+
+def _parse_delay_ms(value):
+    """Parses a delay threshold such as '5ms' (or a bare number) into milliseconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _DELAY_THRESHOLD_RE.match(value)
+    return float(match.group(1)) if match else None
+
 class IntentMonitor:
     """
     Monitors the network to ensure operational intents are met and can trigger
@@ -27,6 +56,11 @@ class IntentMonitor:
         self.topology = topology
         self.net = net
         self.intents = []
+        self.intents_by_type = {}
+        self.intents_by_link = {}
+        self._link_by_endpoints = {}
+        self._ip_cache = {}
+        self._has_fping = None
         self.report = []
         
         # Monitoring control
@@ -36,8 +70,8 @@ class IntentMonitor:
         self._timer = None
         
         # --- Plugin Integration ---
-        # The monitor instantiates its own PluginManager to discover monitoring plugins
-        self.plugin_manager = PluginManager(plugins_dir=Path("plugins"))
+        # The monitor reuses the shared PluginManager to discover monitoring plugins
+        self.plugin_manager = PluginManager.get(Path("plugins"))
         self.check_functions = {}
         self.recovery_functions = {}
         self._register_default_functions()
@@ -45,6 +79,14 @@ class IntentMonitor:
         
         # Parse intents from the topology file
         self._parse_intents()
+
+        # Checks run concurrently on a pool that lives from start_monitoring to
+        # stop_monitoring, but a Mininet node's shell only serves one command at
+        # a time, so checks touching the same node are serialized
+        self._pool = None
+        self._node_locks = {}
+        self._ok_streak = {}
+        self._next_probe_at = {}
         print(f"✔ Intent Monitor initialized with {len(self.intents)} intents.")
 
     def _register_default_functions(self):
@@ -57,6 +99,13 @@ class IntentMonitor:
             'CPU_USAGE': self.check_cpu_usage,
             'MEMORY_USAGE': self.check_memory_usage,
         }
+        # Built-in checks on a node pair that only run commands in the first node's shell
+        self._first_node_checks = {
+            self.check_connectivity,
+            self.check_bandwidth,
+            self.check_delay,
+            self.check_packet_loss,
+        }
         self.recovery_functions = {
             'CONNECTIVITY': self.recover_connectivity,
             'BANDWIDTH': self.recover_link_params,
@@ -78,6 +127,13 @@ class IntentMonitor:
             for intent_type, func in plugin.get_recovery_functions().items():
                 self.recovery_functions[intent_type] = func
                 
+    def _add_intent(self, intent):
+        """Registers an intent, also indexing it by type and, for link parameters, by link."""
+        self.intents.append(intent)
+        self.intents_by_type.setdefault(intent['type'], []).append(intent)
+        if intent['type'] in _LINK_PARAM_OPTIONS:
+            self.intents_by_link.setdefault(frozenset(intent['target']), []).append(intent)
+
     def _parse_intents(self):
         """Parses intents from the topology data."""
         # --- Connectivity Intents ---
@@ -90,43 +146,47 @@ class IntentMonitor:
                     'description': f"Connectivity between {host1_data['id']} and {host2_data['id']}",
                     'status': 'UNKNOWN'
                 }
-                self.intents.append(intent)
+                self._add_intent(intent)
 
         # --- Link Parameter Intents ---
         for conn in self.topology.connections:
             endpoints = tuple(conn.get('ENDPOINTS', []))
             params = conn.get('PARAMS', {})
+            # join() rather than indexing: connections without PARAMS may list fewer than two endpoints
+            link_label = "-".join(map(str, endpoints))
             
             if params.get('BANDWIDTH'):
-                self.intents.append({
+                self._add_intent({
                     'type': 'BANDWIDTH', 'target': endpoints, 'value': params['BANDWIDTH'],
-                    'description': f"Bandwidth <= {params['BANDWIDTH']} Mbps for link {endpoints[0]}-{endpoints[1]}",
+                    'description': f"Bandwidth <= {params['BANDWIDTH']} Mbps for link {link_label}",
                     'status': 'UNKNOWN'
                 })
             if params.get('DELAY'):
-                self.intents.append({
+                # 'value' keeps the original string for Mininet; the check uses the parsed threshold
+                self._add_intent({
                     'type': 'DELAY', 'target': endpoints, 'value': params['DELAY'],
-                    'description': f"Delay <= {params['DELAY']} for link {endpoints[0]}-{endpoints[1]}",
+                    'max_delay_ms': _parse_delay_ms(params['DELAY']),
+                    'description': f"Delay <= {params['DELAY']} for link {link_label}",
                     'status': 'UNKNOWN'
                 })
             if params.get('LOSS'):
-                self.intents.append({
+                self._add_intent({
                     'type': 'PACKET_LOSS', 'target': endpoints, 'value': params['LOSS'],
-                    'description': f"Packet Loss <= {params['LOSS']}% for link {endpoints[0]}-{endpoints[1]}",
+                    'description': f"Packet Loss <= {params['LOSS']}% for link {link_label}",
                     'status': 'UNKNOWN'
                 })
 
         # --- Host Resource Intents ---
         for host_data in self.topology.hosts:
             if host_data.get('max_cpu'): 
-                self.intents.append({
+                self._add_intent({
                     'type': 'CPU_USAGE', 'target': host_data['id'],
                     'value': host_data['max_cpu'], 
                     'description': f"CPU usage <= {host_data['max_cpu']*100}% for host {host_data['id']}",
                     'status': 'UNKNOWN'
                 })
             if host_data.get('max_ram'): 
-                self.intents.append({
+                self._add_intent({
                     'type': 'MEMORY_USAGE', 'target': host_data['id'],
                     'value': host_data['max_ram'],
                     'description': f"Memory usage <= {host_data['max_ram']}MB for host {host_data['id']}",
@@ -137,14 +197,21 @@ class IntentMonitor:
         """Starts the periodic intent monitoring process."""
         if not self._monitoring_active:
             self._monitoring_active = True
+            self._build_link_index()
+            self._ip_cache = {host_data['id']: self.net.get(host_data['id']).IP() for host_data in self.topology.hosts}
+            self._pool = ThreadPoolExecutor(max_workers=min(_MAX_CHECK_WORKERS, max(1, len(self.intents))))
             self._monitor_loop()
             print("✔ Monitoring started.")
 
     def stop_monitoring(self):
         """Stops the intent monitoring process."""
+        self._monitoring_active = False
         if self._timer:
             self._timer.cancel()
-        self._monitoring_active = False
+        if self._pool:
+            # Queued checks are dropped; running ones finish on their own
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         print("✔ Monitoring stopped.")
 
     def _monitor_loop(self):
@@ -153,46 +220,183 @@ class IntentMonitor:
             return
         
         timestamp = datetime.now().isoformat()
+        now = time.monotonic()
         print(f"\n--- Running Intent Check @ {timestamp} ---")
         
-        for intent in self.intents:
-            check_function = self.check_functions.get(intent['type'])
-            if not check_function:
-                print(f"  [?] Warning: No check function found for intent type '{intent['type']}'")
-                continue
-
+        # Fan the probes out first, then handle results in intent order once all
+        # of them are in, so recovery never touches a node a probe is still using
+        pool = self._pool
+        if pool is None:
+            return
+        try:
+            pending, skipped = self._submit_checks(pool, now)
+        except RuntimeError:
+            # stop_monitoring() shut the pool down while this cycle was starting
+            return
+        # Block until every probe is done. Not concurrent.futures.wait(): it is
+        # never woken for futures cancelled by stop_monitoring()'s shutdown
+        for _, future, _ in pending:
             try:
-                is_ok = check_function(intent)
-                
+                future.exception()
+            except CancelledError:
+                pass
+        if not self._monitoring_active:
+            # Stopped mid-cycle: the remaining checks were cancelled, so no results to act on
+            return
+        if skipped:
+            print(f"  [-] Skipped {skipped} stable intent(s) this cycle.")
+
+        # Checks were submitted grouped by type (and connectivity by source
+        # host); put the results back in intent order for logging and recovery
+        position = {id(intent): index for index, intent in enumerate(self.intents)}
+        pending.sort(key=lambda item: position[id(item[0])])
+
+        # Recoveries already run this cycle, keyed by function and target; e.g.
+        # recover_link_params restores every parameter of a link in one go, so
+        # a link with both DELAY and PACKET_LOSS broken only needs it once
+        recovered = set()
+        for intent, future, batch_key in pending:
+            intent_type = intent['type']
+            # Anything but a passing check is probed again on the next cycle
+            ok_streak = self._ok_streak.pop(id(intent), 0)
+            self._next_probe_at.pop(id(intent), None)
+            try:
+                is_ok = future.result() if batch_key is None else future.result().get(batch_key, False)
+
                 if not is_ok:
                     intent['status'] = 'BROKEN'
                     log_entry = f"  [✗] BROKEN: {intent['description']}"
                     print(log_entry)
                     self.report.append({'timestamp': timestamp, 'log': log_entry, 'intent': intent})
-                    
+
                     if self.recovery_enabled:
-                        recovery_function = self.recovery_functions.get(intent['type'])
+                        recovery_function = self.recovery_functions.get(intent_type)
                         if recovery_function:
-                            print(f"    -> Attempting recovery for '{intent['type']}'...")
-                            recovery_function(intent)
+                            target = intent['target']
+                            recovery_key = (recovery_function, tuple(sorted(target)) if isinstance(target, (tuple, list)) else target)
+                            if recovery_key in recovered:
+                                print(f"    -> Recovery for {target} already attempted this cycle.")
+                            else:
+                                recovered.add(recovery_key)
+                                print(f"    -> Attempting recovery for '{intent_type}'...")
+                                recovery_function(intent)
                         else:
-                            print(f"    -> Warning: No recovery function found for intent type '{intent['type']}'")
+                            print(f"    -> Warning: No recovery function found for intent type '{intent_type}'")
                 else:
                     if intent['status'] != 'OK':
                         intent['status'] = 'OK'
                         log_entry = f"  [✔] OK: {intent['description']}"
                         print(log_entry)
                         self.report.append({'timestamp': timestamp, 'log': log_entry, 'intent': intent})
+                    self._schedule_next_probe(intent, ok_streak + 1, now)
 
             except NotImplementedError:
-                print(f"  [!] Not Implemented: Check for '{intent['type']}' on {intent['target']}.")
+                print(f"  [!] Not Implemented: Check for '{intent_type}' on {intent['target']}.")
             except Exception as e:
-                print(f"  [!] ERROR checking intent '{intent['type']}': {e}")
+                print(f"  [!] ERROR checking intent '{intent_type}': {e}")
 
-        # Schedule the next check
+        # Schedule the next check, unless monitoring was stopped meanwhile
+        if not self._monitoring_active:
+            return
         self._timer = threading.Timer(self.monitor_interval, self._monitor_loop)
         self._timer.start()
 
+    def _submit_checks(self, pool, now):
+        """Submits every due check to the pool; returns the (intent, future, batch key) list and the skip count."""
+        pending = []
+        skipped = 0
+        for intent_type, intents in self.intents_by_type.items():
+            check_function = self.check_functions.get(intent_type)
+            if not check_function:
+                print(f"  [?] Warning: No check function found for intent type '{intent_type}'")
+                continue
+            due = [intent for intent in intents if now >= self._next_probe_at.get(id(intent), 0)]
+            skipped += len(intents) - len(due)
+
+            if intent_type == 'CONNECTIVITY' and check_function == self.check_connectivity:
+                # One probe per source host covers all of its connectivity intents
+                by_source = {}
+                for intent in due:
+                    by_source.setdefault(intent['target'][0], []).append(intent)
+                for source_id, source_intents in by_source.items():
+                    ips = [self._get_ip(intent['target'][1]) for intent in source_intents]
+                    future = pool.submit(self._run_locked, [source_id], self._probe_reachability, source_id, ips)
+                    pending.extend((intent, future, ip) for intent, ip in zip(source_intents, ips))
+                continue
+
+            for intent in due:
+                pending.append((intent, pool.submit(self._run_check, check_function, intent), None))
+        return pending, skipped
+
+    def _schedule_next_probe(self, intent, ok_streak, now):
+        """Records a passing check and backs off the intent's next probe once it is stable."""
+        self._ok_streak[id(intent)] = ok_streak
+        if intent['type'] in _ALWAYS_PROBED or ok_streak < _BACKOFF_AFTER_OK:
+            return
+        backoff_cycles = min(2 ** (ok_streak - _BACKOFF_AFTER_OK), _MAX_BACKOFF_CYCLES)
+        self._next_probe_at[id(intent)] = now + backoff_cycles * self.monitor_interval
+
+    def _build_link_index(self):
+        """Indexes the network's links by the unordered pair of node names they join."""
+        link_by_endpoints = {}
+        for link in self.net.links:
+            # Keep the first link between two nodes, as net.linksBetween() would
+            link_by_endpoints.setdefault(frozenset((link.intf1.node.name, link.intf2.node.name)), link)
+        self._link_by_endpoints = link_by_endpoints
+
+    def _get_link(self, node1_id, node2_id):
+        """Returns the link between two nodes, re-indexing once if it is not known yet."""
+        key = frozenset((node1_id, node2_id))
+        link = self._link_by_endpoints.get(key)
+        if link is None:
+            self._build_link_index()
+            link = self._link_by_endpoints.get(key)
+        return link
+
+    def _get_ip(self, node_id):
+        """Returns a node's IP address, asking Mininet only the first time."""
+        ip = self._ip_cache.get(node_id)
+        if ip is None:
+            ip = self._ip_cache[node_id] = self.net.get(node_id).IP()
+        return ip
+
+    def _run_check(self, check_function, intent):
+        """Runs a check function while holding the lock of every node whose shell it uses."""
+        target = intent['target']
+        if not isinstance(target, (tuple, list)):
+            node_ids = [target]
+        elif check_function in self._first_node_checks:
+            # e.g. every link intent of a star topology targets the shared switch;
+            # locking it too would serialize all of them
+            node_ids = [target[0]]
+        else:
+            # Plugin checks may use any node they target
+            node_ids = sorted(set(target))
+        return self._run_locked(node_ids, check_function, intent)
+
+    def _run_locked(self, node_ids, func, *args):
+        """Calls func while holding the shell locks of the given (sorted) nodes."""
+        with ExitStack() as stack:
+            # Locks are always taken in sorted order so overlapping checks cannot deadlock
+            for node_id in node_ids:
+                stack.enter_context(self._node_locks.setdefault(node_id, threading.Lock()))
+            return func(*args)
+
+    def _probe_reachability(self, source_id, ips):
+        """Pings several addresses from one node, returning {ip: reachable}."""
+        source = self.net.get(source_id)
+        if self._has_fping is None:
+            self._has_fping = bool(source.cmd('command -v fping').strip())
+        if not self._has_fping:
+            # Without fping, fall back to one ping per address
+            reachable = {}
+            for ip in ips:
+                match = _PACKET_LOSS_RE.search(source.cmd(f'ping -c 1 {ip}'))
+                reachable[ip] = bool(match) and match.group(1) == '0'
+            return reachable
+        result = source.cmd(f'fping -c 1 -t 1000 -q {" ".join(ips)} 2>&1')
+        return {ip: loss == '0' for ip, loss in _FPING_RESULT_RE.findall(result)}
+
     def export_report(self):
         """
         Exports the monitoring report to a JSON file in the 'logs' directory
@@ -232,8 +436,7 @@ class IntentMonitor:
         """Checks if two hosts can ping each other."""
         host1_id, host2_id = intent['target']
         host1 = self.net.get(host1_id)
-        host2 = self.net.get(host2_id)
-        result = host1.cmd(f'ping -c 1 {host2.IP()}')
+        result = host1.cmd(f'ping -c 1 {self._get_ip(host2_id)}')
         is_successful = '0% packet loss' in result
         return is_successful
 
@@ -242,7 +445,11 @@ class IntentMonitor:
         host1_id, host2_id = intent['target']
         max_bw_mbps = intent['value']
         host1 = self.net.get(host1_id)
-        iface = host1.intfNames()[0]
+        link = self._get_link(host1_id, host2_id)
+        if link:
+            iface = link.intf1.name if link.intf1.node is host1 else link.intf2.name
+        else:
+            iface = host1.intfNames()[0]
 
         # Measure tx bytes over a precise time window
         tx_bytes_1 = int(host1.cmd(f"cat /sys/class/net/{iface}/statistics/tx_bytes").strip())
@@ -272,12 +479,12 @@ class IntentMonitor:
     def check_delay(self, intent):
         """Checks if a link's delay is within the acceptable limit."""
         host1_id, host2_id = intent['target']
-        max_delay_match = re.match(r"(\d+(?:\.\d+)?)ms", intent['value'])
-        max_delay = float(max_delay_match.group(1))
+        max_delay = intent['max_delay_ms']
+        if max_delay is None:
+            raise ValueError(f"invalid delay threshold '{intent['value']}'")
         host1 = self.net.get(host1_id)
-        host2 = self.net.get(host2_id)
-        result = host1.cmd(f'ping -c 3 {host2.IP()}')
-        match = re.search(r'rtt .* = .*?/([\d.]+)/.* ms', result)
+        result = host1.cmd(f'ping -c 3 {self._get_ip(host2_id)}')
+        match = _RTT_AVG_RE.search(result)
         if match:
             avg_delay = float(match.group(1))
             if avg_delay <= max_delay:
@@ -294,9 +501,8 @@ class IntentMonitor:
         host1_id, host2_id = intent['target']
         max_loss = intent['value']
         host1 = self.net.get(host1_id)
-        host2 = self.net.get(host2_id)
-        result = host1.cmd(f'ping -c 5 {host2.IP()}')
-        match = re.search(r'(\d+)% packet loss', result)
+        result = host1.cmd(f'ping -c 5 {self._get_ip(host2_id)}')
+        match = _PACKET_LOSS_RE.search(result)
         if match:
             loss = int(match.group(1))
             return loss <= max_loss
@@ -356,6 +562,9 @@ class IntentMonitor:
             print(f"  -> ACTION: Ensuring interfaces are UP for {host1_id}({iface1}) and {host2_id}({iface2}).")
             host1.cmd(f"ip link set {iface1} up")
             host2.cmd(f"ip link set {iface2} up")
+            # Addresses may differ once the interfaces come back, so look them up again
+            self._ip_cache.pop(host1_id, None)
+            self._ip_cache.pop(host2_id, None)
         except Exception as e:
             print(f"  -> ERROR: Failed to bring interfaces up for {host1_id}-{host2_id}: {e}")        
 
@@ -366,30 +575,19 @@ class IntentMonitor:
         """
         # Get the nodes and link
         node1_id, node2_id = intent['target']
-        target_link = tuple(sorted(intent['target'])) # Use sorted tuple for easy comparison
-
-        node1 = self.net.get(node1_id)
-        node2 = self.net.get(node2_id)
+        target_link = tuple(sorted(intent['target'])) # Use sorted tuple for readable logs
 
-        links = self.net.linksBetween(node1, node2)
-        if not links:
+        link = self._get_link(node1_id, node2_id)
+        if not link:
             print(f"  -> ERROR: Could not find link between {node1_id} and {node2_id}.")
             return
 
-        link = links[0]
         intf1, intf2 = link.intf1, link.intf2
         
         # 1. Find ALL intents related to this link and build a param dict
         link_params = {}
-        for i in self.intents:
-            # Check if the intent's target matches our link
-            if 'target' in i and tuple(sorted(i.get('target', ()))) == target_link:
-                if i['type'] == 'BANDWIDTH':
-                    link_params['bw'] = i['value']
-                elif i['type'] == 'DELAY':
-                    link_params['delay'] = i['value']
-                elif i['type'] == 'PACKET_LOSS':
-                    link_params['loss'] = i['value'] 
+        for i in self.intents_by_link.get(frozenset(intent['target']), ()):
+            link_params[_LINK_PARAM_OPTIONS[i['type']]] = i['value']
                     
         if not link_params:
             # If no params are defined, reset the link to default (no rules)
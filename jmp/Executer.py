@@ -66,26 +66,31 @@ class Executer:
         else:
             return
         self.NETWORK = Mininet()
-
-        if self.TOPOLOGY.MNHOSTS is not []:
-            for HOST in self.TOPOLOGY.MNHOSTS:
+        topo = self.TOPOLOGY
+        addHost = self.NETWORK.addHost
+        addSwitch = self.NETWORK.addSwitch
+        addLink = self.NETWORK.addLink
+        getNode = self.NETWORK.get
+
+        if topo.MNHOSTS:
+            for HOST in topo.MNHOSTS:
                 # Adicionamos o host com o parâmetro inNamespace=True para isolar o monitoramento
-                HOST.ELEM = self.NETWORK.addHost(HOST.ID)
+                HOST.ELEM = addHost(HOST.ID)
 
-        if self.TOPOLOGY.MNSWITCHES is not []:
-            for SWITCH in self.TOPOLOGY.MNSWITCHES:
-                SWITCH.ELEM = self.NETWORK.addSwitch(SWITCH.ID)
+        if topo.MNSWITCHES:
+            for SWITCH in topo.MNSWITCHES:
+                SWITCH.ELEM = addSwitch(SWITCH.ID)
 
-        if self.TOPOLOGY.MNOVSES is not []:
-            for OVSES in self.TOPOLOGY.MNOVSES:
-                OVSES.ELEM = self.NETWORK.addSwitch(OVSES.ID, failMode='standalone')
+        if topo.MNOVSES:
+            for OVSES in topo.MNOVSES:
+                OVSES.ELEM = addSwitch(OVSES.ID, failMode='standalone')
 
-        if self.TOPOLOGY.CONNECTIONS is not []:
-            for CONNECTION in self.TOPOLOGY.CONNECTIONS:
+        if topo.CONNECTIONS:
+            for CONNECTION in topo.CONNECTIONS:
                 # Corrigido para obter os elementos de nó corretos para criar o link
-                node1 = self.NETWORK.get(CONNECTION["IN/OUT"])
-                node2 = self.NETWORK.get(CONNECTION["OUT/IN"])
-                self.NETWORK.addLink(node1, node2)
+                node1 = getNode(CONNECTION["IN/OUT"])
+                node2 = getNode(CONNECTION["OUT/IN"])
+                addLink(node1, node2)
 
 #------------------------------------------------------------------
 
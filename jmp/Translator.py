@@ -19,94 +19,102 @@ class Translator:
 
     def lowLevelTranslation(self):
 
-        llFile = open("LL" + self.TOPOLOGY.ID + ".py", 'w+')
-
-        llFile.write("from mininet.node import *\n\n")
-        llFile.write("def " + self.TOPOLOGY.ID + "():\n\n")
-
-        if self.TOPOLOGY.MNHOSTS is not []:
-            for HOST in self.TOPOLOGY.MNHOSTS:
-                llFile.write("  " + HOST.ID + " = " + "Host('" + HOST.ID + "')\n")
-                llFile.write("  " + HOST.ID + ".setIP('" + HOST.IP + "')\n")
-            llFile.write("\n")
-
-        if self.TOPOLOGY.MNSWITCHES is not []:
-            for SWITCH in self.TOPOLOGY.MNSWITCHES:
-                llFile.write("  " + SWITCH.ID + " = " + "Switch('" + SWITCH.ID + "')\n")
-            llFile.write("\n")
-
-        if self.TOPOLOGY.MNCONTROLLER is not []:
-            for CONTROLLER in self.TOPOLOGY.MNCONTROLLER:
-                llFile.write("  " + CONTROLLER.ID + " = " + "Controller('" + CONTROLLER.ID + "', inNamespace=False)\n")
-                llFile.write("  " + CONTROLLER.ID + ".start()\n")
-            llFile.write("\n")
-
-        if self.TOPOLOGY.MNOVSES is not []:
-            for OVSES in self.TOPOLOGY.MNOVSES:
-                llFile.write("  " + OVSES.ID + " = " + "OVSSwitch('" + OVSES.ID + "', inNamespace=False)\n")
-                llFile.write("  " + OVSES.ID + ".start([" + OVSES.CONTROLLER + "])\n")
-            llFile.write("\n")
-
-        if self.TOPOLOGY.CONNECTIONS is not []:
-            for CONNECTION in self.TOPOLOGY.CONNECTIONS:
-                llFile.write("  Link(" + CONNECTION["IN/OUT"] + ", " + CONNECTION["OUT/IN"] + ")\n")
-            llFile.write("\n")
-
-        llFile.write("  #### SCRIPT AREA ####\n\n")
-        llFile.write("  #####################\n\n")
-
-        if self.TOPOLOGY.MNOVSES is not []:
-            for OVSES in self.TOPOLOGY.MNOVSES:
-                llFile.write("  " + OVSES.ID + ".stop()\n")
-            llFile.write("\n")
-
-        if self.TOPOLOGY.MNCONTROLLER is not []:
-            for CONTROLLER in self.TOPOLOGY.MNCONTROLLER:
-                llFile.write("  " + CONTROLLER.ID + ".stop()\n")
-            llFile.write("\n")
-
-        llFile.write(self.TOPOLOGY.ID + "()")
+        topo = self.TOPOLOGY
+        parts = []
+
+        parts.append("from mininet.node import *\n\n")
+        parts.append("def " + topo.ID + "():\n\n")
+
+        if topo.MNHOSTS:
+            for HOST in topo.MNHOSTS:
+                parts.append("  " + HOST.ID + " = " + "Host('" + HOST.ID + "')\n")
+                parts.append("  " + HOST.ID + ".setIP('" + HOST.IP + "')\n")
+            parts.append("\n")
+
+        if topo.MNSWITCHES:
+            for SWITCH in topo.MNSWITCHES:
+                parts.append("  " + SWITCH.ID + " = " + "Switch('" + SWITCH.ID + "')\n")
+            parts.append("\n")
+
+        if topo.MNCONTROLLER:
+            for CONTROLLER in topo.MNCONTROLLER:
+                parts.append("  " + CONTROLLER.ID + " = " + "Controller('" + CONTROLLER.ID + "', inNamespace=False)\n")
+                parts.append("  " + CONTROLLER.ID + ".start()\n")
+            parts.append("\n")
+
+        if topo.MNOVSES:
+            for OVSES in topo.MNOVSES:
+                parts.append("  " + OVSES.ID + " = " + "OVSSwitch('" + OVSES.ID + "', inNamespace=False)\n")
+                parts.append("  " + OVSES.ID + ".start([" + OVSES.CONTROLLER + "])\n")
+            parts.append("\n")
+
+        if topo.CONNECTIONS:
+            for CONNECTION in topo.CONNECTIONS:
+                parts.append("  Link(" + CONNECTION["IN/OUT"] + ", " + CONNECTION["OUT/IN"] + ")\n")
+            parts.append("\n")
+
+        parts.append("  #### SCRIPT AREA ####\n\n")
+        parts.append("  #####################\n\n")
+
+        if topo.MNOVSES:
+            for OVSES in topo.MNOVSES:
+                parts.append("  " + OVSES.ID + ".stop()\n")
+            parts.append("\n")
+
+        if topo.MNCONTROLLER:
+            for CONTROLLER in topo.MNCONTROLLER:
+                parts.append("  " + CONTROLLER.ID + ".stop()\n")
+            parts.append("\n")
+
+        parts.append(topo.ID + "()")
+
+        with open("LL" + topo.ID + ".py", 'w+') as llFile:
+            llFile.write("".join(parts))
 
 #------------------------------------------------------------------
 
     def midLevelTranslation(self):
 
-        llFile = open("ML" + self.TOPOLOGY.ID + ".py", 'w+')
+        topo = self.TOPOLOGY
+        parts = []
 
-        llFile.write("from mininet.net import Mininet\n")
-        llFile.write("from mininet.cli import CLI\n\n")
+        parts.append("from mininet.net import Mininet\n")
+        parts.append("from mininet.cli import CLI\n\n")
 
-        llFile.write("def " + self.TOPOLOGY.ID + "():\n\n")
+        parts.append("def " + topo.ID + "():\n\n")
 
-        llFile.write("  NETWORK = Mininet()\n\n")
+        parts.append("  NETWORK = Mininet()\n\n")
 
-        if self.TOPOLOGY.MNHOSTS is not []:
-            for HOST in self.TOPOLOGY.MNHOSTS:
-                llFile.write("  " + HOST.ID + " = " + "NETWORK.addHost('" + HOST.ID + "')\n")
-            llFile.write("\n")
+        if topo.MNHOSTS:
+            for HOST in topo.MNHOSTS:
+                parts.append("  " + HOST.ID + " = " + "NETWORK.addHost('" + HOST.ID + "')\n")
+            parts.append("\n")
 
-        if self.TOPOLOGY.MNSWITCHES is not []:
-            for SWITCH in self.TOPOLOGY.MNSWITCHES:
-                llFile.write("  " + SWITCH.ID + " = " + "NETWORK.addSwitch('" + SWITCH.ID + "')\n")
-            llFile.write("\n")
+        if topo.MNSWITCHES:
+            for SWITCH in topo.MNSWITCHES:
+                parts.append("  " + SWITCH.ID + " = " + "NETWORK.addSwitch('" + SWITCH.ID + "')\n")
+            parts.append("\n")
 
-        if self.TOPOLOGY.MNCONTROLLER is not []:
-            for CONTROLLER in self.TOPOLOGY.MNCONTROLLER:
-                llFile.write("  " + CONTROLLER.ID + " = " + "NETWORK.addController('" + CONTROLLER.ID + "')\n")
-            llFile.write("\n")
+        if topo.MNCONTROLLER:
+            for CONTROLLER in topo.MNCONTROLLER:
+                parts.append("  " + CONTROLLER.ID + " = " + "NETWORK.addController('" + CONTROLLER.ID + "')\n")
+            parts.append("\n")
 
-        if self.TOPOLOGY.MNOVSES is not []:
-            for OVSES in self.TOPOLOGY.MNOVSES:
-                llFile.write("  " + OVSES.ID + " = " + "NETWORK.addSwitch('" + OVSES.ID + "')\n")
-            llFile.write("\n")
+        if topo.MNOVSES:
+            for OVSES in topo.MNOVSES:
+                parts.append("  " + OVSES.ID + " = " + "NETWORK.addSwitch('" + OVSES.ID + "')\n")
+            parts.append("\n")
 
-        if self.TOPOLOGY.CONNECTIONS is not []:
-            for CONNECTION in self.TOPOLOGY.CONNECTIONS:
-                llFile.write("  NETWORK.addLink(" + CONNECTION["IN/OUT"] + ", " + CONNECTION["OUT/IN"] + ")\n")
-            llFile.write("\n")
+        if topo.CONNECTIONS:
+            for CONNECTION in topo.CONNECTIONS:
+                parts.append("  NETWORK.addLink(" + CONNECTION["IN/OUT"] + ", " + CONNECTION["OUT/IN"] + ")\n")
+            parts.append("\n")
 
-        llFile.write("  NETWORK.start()\n")
-        llFile.write("  CLI(NETWORK)\n")
-        llFile.write("  NETWORK.stop()\n\n")
+        parts.append("  NETWORK.start()\n")
+        parts.append("  CLI(NETWORK)\n")
+        parts.append("  NETWORK.stop()\n\n")
 
-        llFile.write(self.TOPOLOGY.ID + "()")
\ No newline at end of file
+        parts.append(topo.ID + "()")
+
+        with open("ML" + topo.ID + ".py", 'w+') as llFile:
+            llFile.write("".join(parts))
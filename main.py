@@ -1,173 +1,316 @@
+import os
+import sys
 import json
-import importlib
-import inspect
+import mmap
+import logging
+import functools
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Protocol, Callable
-from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Protocol, Callable, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (the 'speedups' extra); fall back to the stdlib parser
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is optional; topologies are then not validated
+    fastjsonschema = None
+
+# Plugin loading and execution messages; main() routes INFO to stdout,
+# library users stay quiet unless they configure logging themselves
+_log = logging.getLogger(__name__)
 
 # ========================== Plugin System ==========================
 
-class PluginInterface(ABC):
-    """Base interface for all plugins."""
+class PluginInterface:
+    """
+    Base interface for all plugins. Subclasses override every method of their
+    plugin type; the defaults raise NotImplementedError.
+    """
     
-    @abstractmethod
     def get_name(self) -> str:
         """Return the plugin name."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_version(self) -> str:
         """Return the plugin version."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_description(self) -> str:
         """Return the plugin description."""
-        pass
+        raise NotImplementedError
 
 
 class TopologyPlugin(PluginInterface):
     """Base class for topology manipulation plugins."""
     
-    @abstractmethod
     def process_topology(self, topology: 'Topology', params: Dict[str, Any]) -> None:
         """Process the topology with given parameters."""
-        pass
+        raise NotImplementedError
 
 
 class ScriptGeneratorPlugin(PluginInterface):
     """Base class for script generation plugins."""
     
-    @abstractmethod
     def generate_imports(self) -> List[str]:
         """Generate additional import statements."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def generate_pre_network_code(self, topology: 'Topology', params: Dict[str, Any]) -> List[str]:
         """Generate code to be inserted before network creation."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def generate_post_network_code(self, topology: 'Topology', params: Dict[str, Any]) -> List[str]:
         """Generate code to be inserted after network creation."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def generate_post_start_code(self, topology: 'Topology', params: Dict[str, Any]) -> List[str]:
         """Generate code to be inserted after network start."""
-        pass
+        raise NotImplementedError
 
 
 class ComponentPlugin(PluginInterface):
     """Base class for custom network component plugins."""
     
-    @abstractmethod
     def parse_component(self, component_data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse custom component data."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def generate_component_code(self, component: Dict[str, Any]) -> List[str]:
         """Generate Mininet code for the custom component."""
-        pass
+        raise NotImplementedError
 
 class MonitorRecoveryPlugin(PluginInterface):
     """Base class for intent monitor and recovery plugins."""
     
-    @abstractmethod
     def get_check_functions(self) -> Dict[str, Callable]:
         """
         Return a dictionary mapping intent types to check functions.
         Example: {'MY_CUSTOM_INTENT': self.my_check_function}
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_recovery_functions(self) -> Dict[str, Callable]:
         """
         Return a dictionary mapping intent types to recovery functions.
         Example: {'MY_CUSTOM_INTENT': self.my_recovery_function}
         """
-        pass
+        raise NotImplementedError
+
+
+# Abstract bases that plugin discovery must not instantiate
+_BASE_PLUGIN_CLASSES = frozenset({
+    PluginInterface, TopologyPlugin, ScriptGeneratorPlugin, ComponentPlugin, MonitorRecoveryPlugin
+})
+
+
+# PluginManager instances shared through PluginManager.get(), by resolved plugins directory
+_PLUGIN_MANAGER_CACHE: Dict[Path, 'PluginManager'] = {}
+
+
+def _plugin_file_key(name: str) -> str:
+    """Normalise a plugin or module name so "QoSPlugin", "qos_plugin" and "qos" all match."""
+    key = name.lower().replace("_", "").replace("-", "")
+    for suffix in ("plugins", "plugin"):
+        if key.endswith(suffix) and key != suffix:
+            return key[:-len(suffix)]
+    return key
 
 
 class PluginManager:
     """Manages loading and execution of plugins."""
     
+    @classmethod
+    def get(cls, plugins_dir: Path = None) -> 'PluginManager':
+        """
+        Return the shared manager for a plugins directory, scanning and
+        importing its plugins only the first time the directory is requested.
+        """
+        plugins_dir = plugins_dir or Path("plugins")
+        key = plugins_dir.resolve()
+        manager = _PLUGIN_MANAGER_CACHE.get(key)
+        if manager is None:
+            manager = _PLUGIN_MANAGER_CACHE[key] = cls(plugins_dir)
+        return manager
+    
     def __init__(self, plugins_dir: Path = None):
         self.plugins_dir = plugins_dir or Path("plugins")
-        self.loaded_plugins = {}
-        self.topology_plugins = []
-        self.script_plugins = []
-        self.component_plugins = {}
-        self.monitor_recovery_plugins = [] 
+        # Filled by _load_all_plugins the first time any of the public
+        # properties below is read, so runs that never touch a plugin
+        # never import the plugin modules
+        self._plugins_loaded = False
+        self._loaded_files = set()
+        self._loaded_plugins = {}
+        self._topology_plugins = []
+        self._script_plugins = []
+        self._component_plugins = {}
+        self._monitor_recovery_plugins = []
+        # Name lookups per plugin type, filled while loading so dispatch needs no isinstance()
+        self._topology_by_name = {}
+        self._script_by_name = {}
+        
+        # Run topology plugins concurrently in threads; off by default since
+        # most plugins modify the topology and expect to run in config order
+        self.parallel_plugins = False
         
         # Ensure plugins directory exists
         self.plugins_dir.mkdir(exist_ok=True)
-        
-        # Load all available plugins
-        self._load_all_plugins()
+    
+    def _ensure_loaded(self):
+        if not self._plugins_loaded:
+            self._plugins_loaded = True
+            self._load_all_plugins()
+    
+    @property
+    def loaded_plugins(self) -> Dict[str, PluginInterface]:
+        self._ensure_loaded()
+        return self._loaded_plugins
+    
+    @property
+    def topology_plugins(self) -> List[TopologyPlugin]:
+        self._ensure_loaded()
+        return self._topology_plugins
+    
+    @property
+    def script_plugins(self) -> List[ScriptGeneratorPlugin]:
+        self._ensure_loaded()
+        return self._script_plugins
+    
+    @property
+    def component_plugins(self) -> Dict[str, ComponentPlugin]:
+        self._ensure_loaded()
+        return self._component_plugins
+    
+    @property
+    def monitor_recovery_plugins(self) -> List[MonitorRecoveryPlugin]:
+        self._ensure_loaded()
+        return self._monitor_recovery_plugins
+    
+    @property
+    def topology_by_name(self) -> Dict[str, TopologyPlugin]:
+        self._ensure_loaded()
+        return self._topology_by_name
+    
+    @property
+    def script_by_name(self) -> Dict[str, ScriptGeneratorPlugin]:
+        self._ensure_loaded()
+        return self._script_by_name
+    
+    def _plugin_files(self) -> List[Path]:
+        """List the plugin modules in the plugins directory, in load order."""
+        if not self.plugins_dir.exists():
+            return []
+        # Reuse the memoised directory listing; it is only rebuilt when the
+        # plugins directory's mtime changes
+        plugin_files = _scan_dir(self.plugins_dir, self.plugins_dir.stat().st_mtime_ns)
+        return [plugin_file for _, plugin_file in plugin_files
+                if plugin_file.suffix == ".py" and not plugin_file.name.startswith("_")]
     
     def _load_all_plugins(self):
         """Load all plugins from the plugins directory."""
-        if not self.plugins_dir.exists():
+        for plugin_file in self._plugin_files():
+            self._load_plugin_file(plugin_file)
+    
+    def _load_plugin_file(self, plugin_file: Path):
+        """Import one plugin module and register every plugin class it defines."""
+        if plugin_file in self._loaded_files:
             return
+        self._loaded_files.add(plugin_file)
+        
+        # Only needed when plugins are actually loaded, so not imported at module level
+        import importlib
         
         # Add plugins directory to path
-        import sys
         if str(self.plugins_dir) not in sys.path:
             sys.path.insert(0, str(self.plugins_dir))
         
-        for plugin_file in self.plugins_dir.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue
+        try:
+            module_name = plugin_file.stem
+            # Plugins already imported by another manager are reused as-is
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
             
-            try:
-                module_name = plugin_file.stem
-                module = importlib.import_module(module_name)
-                
-                # Find all plugin classes in the module
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and 
-                        issubclass(obj, PluginInterface) and 
-                        obj not in [PluginInterface, TopologyPlugin, ScriptGeneratorPlugin, ComponentPlugin, MonitorRecoveryPlugin]):
-                        
-                        plugin_instance = obj()
-                        plugin_name = plugin_instance.get_name()
-                        self.loaded_plugins[plugin_name] = plugin_instance
-                        
-                        # Categorize plugin
-                        if isinstance(plugin_instance, TopologyPlugin):
-                            self.topology_plugins.append(plugin_instance)
-                        elif isinstance(plugin_instance, ScriptGeneratorPlugin):
-                            self.script_plugins.append(plugin_instance)
-                        elif isinstance(plugin_instance, ComponentPlugin):
-                            self.component_plugins[plugin_name] = plugin_instance
-                        elif isinstance(plugin_instance, MonitorRecoveryPlugin):
-                            self.monitor_recovery_plugins.append(plugin_instance)
-                        
-                        print(f"✔ Loaded plugin: {plugin_name} v{plugin_instance.get_version()}")
-            
-            except Exception as e:
-                print(f"✗ Failed to load plugin from {plugin_file.name}: {e}")
+            # Find all plugin classes in the module; dir() is already sorted,
+            # so plugins load in the same order inspect.getmembers() gave
+            for name in dir(module):
+                obj = getattr(module, name, None)
+                if (isinstance(obj, type) and 
+                    issubclass(obj, PluginInterface) and 
+                    obj not in _BASE_PLUGIN_CLASSES):
+                    
+                    plugin_instance = obj()
+                    plugin_name = plugin_instance.get_name()
+                    self._loaded_plugins[plugin_name] = plugin_instance
+                    
+                    # Categorize plugin
+                    if isinstance(plugin_instance, TopologyPlugin):
+                        self._topology_plugins.append(plugin_instance)
+                        self._topology_by_name[plugin_name] = plugin_instance
+                    elif isinstance(plugin_instance, ScriptGeneratorPlugin):
+                        self._script_plugins.append(plugin_instance)
+                        self._script_by_name[plugin_name] = plugin_instance
+                    elif isinstance(plugin_instance, ComponentPlugin):
+                        self._component_plugins[plugin_name] = plugin_instance
+                    elif isinstance(plugin_instance, MonitorRecoveryPlugin):
+                        self._monitor_recovery_plugins.append(plugin_instance)
+                    
+                    # Checked first so get_version() is not called when INFO is off
+                    if _log.isEnabledFor(logging.INFO):
+                        _log.info("✔ Loaded plugin: %s v%s", plugin_name, plugin_instance.get_version())
+        
+        except Exception as e:
+            _log.warning("✗ Failed to load plugin from %s: %s", plugin_file.name, e)
+    
+    def _find_plugin(self, name: str, index: Dict[str, PluginInterface]) -> Optional[PluginInterface]:
+        """
+        Look up a plugin by name in one of the private indexes. Before the
+        whole directory is loaded, modules whose file name matches the plugin
+        name (e.g. "QoS" -> qos.py or qos_plugin.py) are imported first; the
+        full load is the fallback for plugins no matching file provided.
+        """
+        plugin = index.get(name)
+        if plugin is None and not self._plugins_loaded:
+            if name:
+                wanted = _plugin_file_key(name)
+                for plugin_file in self._plugin_files():
+                    if _plugin_file_key(plugin_file.stem) == wanted:
+                        self._load_plugin_file(plugin_file)
+                plugin = index.get(name)
+            # Plugin names are unique across types (loaded_plugins is keyed by
+            # name), so a match of another type means a full load cannot help
+            if plugin is None and name not in self._loaded_plugins:
+                self._ensure_loaded()
+                plugin = index.get(name)
+        return plugin
 
     def get_plugin(self, name: str) -> Optional[PluginInterface]:
         """Get a specific plugin by name."""
-        return self.loaded_plugins.get(name)
+        return self._find_plugin(name, self._loaded_plugins)
     
     def execute_topology_plugins(self, topology: 'Topology', plugin_configs: List[Dict[str, Any]]):
         """Execute topology plugins based on configuration."""
-        for config in plugin_configs:
-            plugin_name = config.get("name")
-            plugin_params = config.get("params", {})
-            
-            plugin = self.get_plugin(plugin_name)
-            if plugin and isinstance(plugin, TopologyPlugin):
-                print(f"  Executing topology plugin: {plugin_name}")
-                plugin.process_topology(topology, plugin_params)
-            else:
-                print(f"  Warning: Topology plugin '{plugin_name}' not found or invalid")
+        if self.parallel_plugins and len(plugin_configs) > 1:
+            # Only safe for plugins that do independent I/O: they all receive
+            # the same topology and run in no particular order
+            with ThreadPoolExecutor(max_workers=min(8, len(plugin_configs))) as executor:
+                for future in [executor.submit(self._run_topology_plugin, topology, config)
+                               for config in plugin_configs]:
+                    future.result()
+        else:
+            for config in plugin_configs:
+                self._run_topology_plugin(topology, config)
+    
+    def _run_topology_plugin(self, topology: 'Topology', config: Dict[str, Any]):
+        plugin_name = config.get("name")
+        plugin_params = config.get("params", {})
+        
+        plugin = self._find_plugin(plugin_name, self._topology_by_name)
+        if plugin is not None:
+            _log.info("  Executing topology plugin: %s", plugin_name)
+            plugin.process_topology(topology, plugin_params)
+        else:
+            _log.warning("  Warning: Topology plugin '%s' not found or invalid", plugin_name)
     
     def get_script_generator_additions(self, topology: 'Topology', plugin_configs: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Get code additions from script generator plugins."""
@@ -182,8 +325,8 @@ class PluginManager:
             plugin_name = config.get("name")
             plugin_params = config.get("params", {})
             
-            plugin = self.get_plugin(plugin_name)
-            if plugin and isinstance(plugin, ScriptGeneratorPlugin):
+            plugin = self._find_plugin(plugin_name, self._script_by_name)
+            if plugin is not None:
                 additions["imports"].extend(plugin.generate_imports())
                 additions["pre_network"].extend(plugin.generate_pre_network_code(topology, plugin_params))
                 additions["post_network"].extend(plugin.generate_post_network_code(topology, plugin_params))
@@ -192,58 +335,123 @@ class PluginManager:
         return additions
 
 
+# Structural checks for a topology document. Only the shapes the parser
+# relies on are enforced; unknown keys are allowed so plugins can add their own
+_COMPONENT_LIST = {"type": "array", "items": {"type": "object"}}
+TOPOLOGY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ID": {"type": "string"},
+        "VERSION": {"type": ["string", "number"]},
+        "DESCRIPTION": {"type": "string"},
+        "COMPONENTS": {
+            "type": "object",
+            "properties": {
+                "HOSTS": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "ID": {"type": "string"},
+                            "IP": {"type": "string"},
+                            "MAC": {"type": "string"},
+                        },
+                    },
+                },
+                "SWITCHES": _COMPONENT_LIST,
+                "CONTROLLERS": _COMPONENT_LIST,
+            },
+            # Custom components may be a list of items or a single object (see _parse_custom_components)
+            "additionalProperties": {"type": ["array", "object"]},
+        },
+        "CONNECTIONS": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "ENDPOINTS": {"type": "array", "items": {"type": "string"}},
+                    "PARAMS": {"type": "object"},
+                },
+            },
+        },
+        "PLUGINS": _COMPONENT_LIST,
+        "MONITORING": {"type": "object"},
+    },
+}
+
+# Compiled once at import; compiling is far more expensive than validating
+_validate_topology = fastjsonschema.compile(TOPOLOGY_SCHEMA) if fastjsonschema is not None else None
+
+# Host keys with a fixed lowercase name; every other key is lowercased as-is
+_HOST_CANONICAL = {"ID": "id", "IP": "ip", "MAC": "mac"}
+_HOST_FIXED_KEYS = frozenset(_HOST_CANONICAL.values())
+
+# Component types parsed by Topology itself; anything else goes to a ComponentPlugin
+_STANDARD_COMPONENT_TYPES = frozenset({"HOSTS", "SWITCHES", "CONTROLLERS"})
+
+
 class Topology:
     """Represents the network topology, read from a JSON file."""
-    
+
+    # Fixed attributes live in slots; '__dict__' is kept so topology plugins
+    # can still attach their own attributes in process_topology()
+    __slots__ = (
+        'plugin_manager', 'id', 'id_cap', 'version', 'description',
+        'hosts', 'switches', 'controllers', 'connections', 'custom_components',
+        'plugins_config', 'monitoring_config', 'enable_monitoring',
+        'monitor_interval', 'recovery_enabled', '__dict__',
+    )
+
     def __init__(self, json_data: Dict[str, Any], plugin_manager: PluginManager = None):
-        self._json_data = json_data
-        self.plugin_manager = plugin_manager or PluginManager()
+        if _validate_topology is not None:
+            _validate_topology(json_data)
+        
+        # The raw JSON is only read here; it is not kept on the instance so the
+        # full document can be freed once the parsed lists are built
+        self.plugin_manager = plugin_manager or PluginManager.get()
         
-        components = self._json_data.get("COMPONENTS", {})
+        components = json_data.get("COMPONENTS", {})
         
-        self.id = self._json_data.get("ID", "unknown_topology").lower()
-        self.version = self._json_data.get("VERSION", "N/A")
-        self.description = self._json_data.get("DESCRIPTION", "No description provided.")
+        self.id = json_data.get("ID", "unknown_topology").lower()
+        self.id_cap = self.id.capitalize()
+        self.version = json_data.get("VERSION", "N/A")
+        self.description = json_data.get("DESCRIPTION", "No description provided.")
         
         # Parse standard components
         self.hosts = self._parse_hosts(components)
         self.switches = self._parse_switches(components)
         self.controllers = self._parse_controllers(components)
-        self.connections = self._parse_connections()
+        self.connections = self._parse_connections(json_data)
         
         # Parse custom components via plugins
         self.custom_components = self._parse_custom_components(components)
         
         # Get plugin configurations
-        self.plugins_config = self._json_data.get("PLUGINS", [])
+        self.plugins_config = json_data.get("PLUGINS", [])
         
         # Get monitoring configuration
-        self.monitoring_config = self._json_data.get("MONITORING", {})
+        self.monitoring_config = json_data.get("MONITORING", {})
         self.enable_monitoring = self.monitoring_config.get("enabled", True)
         self.monitor_interval = self.monitoring_config.get("interval", 5)
         self.recovery_enabled = self.monitoring_config.get("recovery_enabled", True)
         
         # Execute topology plugins
         if self.plugins_config:
-            print("\nExecuting topology plugins...")
+            _log.info("\nExecuting topology plugins...")
             self.plugin_manager.execute_topology_plugins(self, self.plugins_config)
     
     def _parse_hosts(self, components: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # Hosts without an ID are skipped; additional parameters are kept lowercased
+        canonical = _HOST_CANONICAL.get
         parsed_hosts = []
-        hosts_data = components.get("HOSTS", [])
-        for host in hosts_data:
-            host_info = {
-                "id": host.get("ID"),
-                "ip": host.get("IP"),
-                "mac": host.get("MAC")
-            }
-            # Include any additional parameters
+        for host in components.get("HOSTS", ()):
+            if not host.get("ID"):
+                continue
+            # Seeding the three fixed keys keeps them first and present even when absent
+            host_info = {"id": None, "ip": None, "mac": None}
             for key, value in host.items():
-                if key not in ["ID", "IP", "MAC"]:
-                    host_info[key.lower()] = value
-            
-            if host_info["id"]:
-                parsed_hosts.append(host_info)
+                host_info[canonical(key) or key.lower()] = value
+            parsed_hosts.append(host_info)
         return parsed_hosts
     
     def _parse_switches(self, components: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -252,15 +460,15 @@ class Topology:
     def _parse_controllers(self, components: Dict[str, Any]) -> List[Dict[str, Any]]:
         return components.get("CONTROLLERS", [])
     
-    def _parse_connections(self) -> List[Dict[str, Any]]:
-        return self._json_data.get("CONNECTIONS", [])
+    def _parse_connections(self, json_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return json_data.get("CONNECTIONS", [])
     
     def _parse_custom_components(self, components: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
         """Parse custom components using registered plugins."""
         custom_components = {}
         
         for component_type, component_data in components.items():
-            if component_type not in ["HOSTS", "SWITCHES", "CONTROLLERS"]:
+            if component_type not in _STANDARD_COMPONENT_TYPES:
                 # Check if there's a plugin for this component type
                 if component_type in self.plugin_manager.component_plugins:
                     plugin = self.plugin_manager.component_plugins[component_type]
@@ -278,245 +486,303 @@ class Topology:
     
     def print_details(self):
         """Print topology details in an organized manner."""
-        print(f"\n--- Topology Details: {self.id.capitalize()} (v{self.version}) ---")
-        print(f"Description: {self.description}\n")
+        # Collect every line and print them in one call instead of once per element
+        lines = []
+        lines.append(f"\n--- Topology Details: {self.id_cap} (v{self.version}) ---")
+        lines.append(f"Description: {self.description}\n")
         
-        print("Hosts:")
+        lines.append("Hosts:")
         if not self.hosts:
-            print("  None")
+            lines.append("  None")
         for host in self.hosts:
             ip_info = f", IP: {host['ip']}" if host.get('ip') else ""
             mac_info = f", MAC: {host['mac']}" if host.get('mac') else ""
             extra_info = ", ".join([f"{k.upper()}: {v}" for k, v in host.items() 
-                                   if k not in ['id', 'ip', 'mac']])
+                                   if k not in _HOST_FIXED_KEYS])
             if extra_info:
                 extra_info = f", {extra_info}"
-            print(f"  - ID: {host['id']}{ip_info}{mac_info}{extra_info}")
+            lines.append(f"  - ID: {host['id']}{ip_info}{mac_info}{extra_info}")
         
-        print("\nSwitches:")
+        lines.append("\nSwitches:")
         if not self.switches:
-            print("  None")
-        for switch in self.switches:
-            params_info = f", PARAMS: {switch.get('PARAMS', {})}"
-            print(f"  - ID: {switch.get('ID')}, TYPE: {switch.get('TYPE', 'Default')}{params_info}")
+            lines.append("  None")
+        lines.extend(
+            f"  - ID: {switch.get('ID')}, TYPE: {switch.get('TYPE', 'Default')}, PARAMS: {switch.get('PARAMS', {})}"
+            for switch in self.switches
+        )
         
-        print("\nControllers:")
+        lines.append("\nControllers:")
         if not self.controllers:
-            print("  None")
-        for controller in self.controllers:
-            params_info = f", PARAMS: {controller.get('PARAMS', {})}"
-            print(f"  - ID: {controller.get('ID')}, TYPE: {controller.get('TYPE', 'Default')}{params_info}")
+            lines.append("  None")
+        lines.extend(
+            f"  - ID: {controller.get('ID')}, TYPE: {controller.get('TYPE', 'Default')}, PARAMS: {controller.get('PARAMS', {})}"
+            for controller in self.controllers
+        )
         
-        print("\nConnections:")
+        lines.append("\nConnections:")
         if not self.connections:
-            print("  None")
+            lines.append("  None")
         for conn in self.connections:
             endpoints = conn.get('ENDPOINTS', ['N/A', 'N/A'])
             params_info = f", PARAMS: {conn.get('PARAMS', {})}"
-            print(f"  - ENDPOINTS: {endpoints[0]} <--> {endpoints[1]}{params_info}")
+            lines.append(f"  - ENDPOINTS: {endpoints[0]} <--> {endpoints[1]}{params_info}")
         
         # Print custom components
         for component_type, components in self.custom_components.items():
-            print(f"\n{component_type}:")
+            lines.append(f"\n{component_type}:")
             if not components:
-                print("  None")
-            for component in components:
-                print(f"  - {component}")
+                lines.append("  None")
+            lines.extend(f"  - {component}" for component in components)
         
         # Print plugin configurations
         if self.plugins_config:
-            print("\nConfigured Plugins:")
-            for plugin in self.plugins_config:
-                print(f"  - {plugin.get('name')} with params: {plugin.get('params', {})}")
+            lines.append("\nConfigured Plugins:")
+            lines.extend(
+                f"  - {plugin.get('name')} with params: {plugin.get('params', {})}"
+                for plugin in self.plugins_config
+            )
         
         # Print monitoring configuration
-        print(f"\nMonitoring Configuration:")
-        print(f"  - Enabled: {self.enable_monitoring}")
-        print(f"  - Interval: {self.monitor_interval}s")
-        print(f"  - Recovery: {self.recovery_enabled}")
+        lines.append(f"\nMonitoring Configuration:")
+        lines.append(f"  - Enabled: {self.enable_monitoring}")
+        lines.append(f"  - Interval: {self.monitor_interval}s")
+        lines.append(f"  - Recovery: {self.recovery_enabled}")
+        
+        lines.append("\n" + "-" * 40)
         
-        print("\n" + "-" * 40)
+        print("\n".join(lines))
 
 
 # ========================== Script Generator ==========================
 
+# Switch classes the generated script can use directly
+_VALID_SWITCHES = frozenset({"OVSKernelSwitch", "UserSwitch"})
+
+# Leading addHost() arguments, indexed by (has_ip << 1) | has_mac
+_HOST_HEAD_TEMPLATES = (
+    "'{id}'",
+    "'{id}', mac='{mac}'",
+    "'{id}', ip='{ip}'",
+    "'{id}', ip='{ip}', mac='{mac}'",
+)
+
+# Host keys rendered by _write_hosts itself rather than passed through as extras
+_HOST_SKIP = frozenset({'id', 'ip', 'mac', 'max_cpu', 'max_ram'})
+
+# Link parameter names that differ between the JSON file and Mininet
+_LINK_PARAM_NAMES = {'bandwidth': 'bw'}
+
+
+@functools.lru_cache(maxsize=None)
+def _link_param_prefix(key: str) -> str:
+    """Return the ', name=' text for a JSON link parameter key, resolved once per key."""
+    name = key.lower()
+    return f", {_LINK_PARAM_NAMES.get(name, name)}="
+
+
+# Import block shared by every generated script
+_IMPORT_BLOCK = (
+    "from mininet.net import Mininet\n"
+    "from mininet.node import Controller, RemoteController, OVSKernelSwitch, UserSwitch\n"
+    "from mininet.cli import CLI\n"
+    "from mininet.log import setLogLevel, info\n"
+    "from mininet.link import TCLink\n"
+)
+
+# Bound format method for one addLink() line: endpoint, endpoint, ", params" suffix
+_ADD_LINK = "\tnet.addLink({}, {}{})\n".format
+
+# Bound format methods for the other per-component lines, keyed on the component ID
+_ADD_CONTROLLER = "\t{0} = net.addController('{0}')\n".format
+_ADD_REMOTE_CONTROLLER = "\t{0} = net.addController('{0}', controller=RemoteController, ip='{1}', port={2})\n".format
+_ADD_HOST = "\t{0} = net.addHost({1})\n".format
+_ADD_SWITCH = "\t{0} = net.addSwitch('{0}')\n".format
+_STANDALONE_FLOW = "\tnet.get('{0}').cmd('ovs-ofctl add-flow {0} \"priority=0,actions=normal\"')\n".format
+
+
 class MininetScriptGenerator:
     """Generates Mininet Python scripts from topology."""
     
     def __init__(self, plugin_manager: PluginManager = None):
-        self.plugin_manager = plugin_manager or PluginManager()
+        self.plugin_manager = plugin_manager or PluginManager.get()
     
     def generate(self, topology: Topology, output_file: str = "topology.py"):
         """Generate a Mininet Python script based on the provided topology."""
+        # The script is built fully in memory first, so a failure never leaves
+        # a truncated file behind; encode once and write bytes, bypassing the
+        # text-mode encoding layer
+        script = self.generate_str(topology)
+        with open(output_file, "wb") as mn_file:
+            mn_file.write(script.encode('utf-8'))
+    
+    def generate_str(self, topology: Topology) -> str:
+        """Return the Mininet Python script for the topology as a string."""
         
         # Default to OVSKernelSwitch for compatibility
         switch_class = "OVSKernelSwitch"
+        topology_id = topology.id
         has_controllers = bool(topology.controllers)
+        enable_monitoring = topology.enable_monitoring
         
         # Validate switch types
         for switch in topology.switches:
             s_type = switch.get("TYPE")
-            if s_type and s_type not in ["OVSKernelSwitch", "UserSwitch"]:
+            if s_type and s_type not in _VALID_SWITCHES:
                 print(f"Warning: Switch type '{s_type}' will be ignored. Using '{switch_class}' as default.")
         
         # Get plugin additions
         plugin_additions = self.plugin_manager.get_script_generator_additions(
             topology, topology.plugins_config
         )
+        pre_network = plugin_additions["pre_network"]
+        post_network = plugin_additions["post_network"]
+        post_start = plugin_additions["post_start"]
         
-        with open(output_file, "w+", encoding='utf-8') as mn_file:
-            # Write header and imports
-            self._write_header(mn_file, topology)
-            self._write_imports(mn_file, plugin_additions["imports"], topology.enable_monitoring)
-            
-            # Write topology function
-            mn_file.write(f"def {topology.id}_topology():\n\n")
-            mn_file.write("\t'Creates and configures the network topology.'\n")
-            
-            # Pre-network plugin code
-            for line in plugin_additions["pre_network"]:
-                mn_file.write(f"\t{line}\n")
-            if plugin_additions["pre_network"]:
-                mn_file.write("\n")
-            
-            # Network initialization
-            controller_param = "Controller" if has_controllers else "None"
-            wait_connected_param = "True" if has_controllers else "False"
-            mn_file.write(f"\tnet = Mininet(controller={controller_param}, switch={switch_class}, "
-                         f"link=TCLink, waitConnected={wait_connected_param})\n\n")
-            
-            # Post-network plugin code
-            for line in plugin_additions["post_network"]:
-                mn_file.write(f"\t{line}\n")
-            if plugin_additions["post_network"]:
-                mn_file.write("\n")
-            
-            # Add standard components
-            self._write_controllers(mn_file, topology)
-            self._write_hosts(mn_file, topology)
-            self._write_switches(mn_file, topology)
-            self._write_links(mn_file, topology)
-            
-            # Add custom components via plugins
-            self._write_custom_components(mn_file, topology)
-            
-            # Start network
-            mn_file.write("\tinfo('*** Starting network\\n')\n")
-            mn_file.write("\tnet.start()\n\n")
-            
-            # Post-start plugin code
-            for line in plugin_additions["post_start"]:
-                mn_file.write(f"\t{line}\n")
-            if plugin_additions["post_start"]:
-                mn_file.write("\n")
-            
-            # Configure OVS for standalone mode if no controller
-            if not has_controllers:
-                self._write_standalone_config(mn_file, topology)
-            
-            # Add intent monitoring if enabled
-            if topology.enable_monitoring:
-                self._write_intent_monitoring(mn_file, topology)
-            
-            # CLI and cleanup
-            mn_file.write("\tinfo('*** Running CLI\\n')\n")
-            mn_file.write("\tCLI(net)\n\n")
-            
-            # Stop monitoring if enabled
-            if topology.enable_monitoring:
-                mn_file.write("\tinfo('*** Stopping intent monitor\\n')\n")
-                mn_file.write("\tif 'monitor' in locals():\n")
-                mn_file.write("\t\tmonitor.stop_monitoring()\n")
-                mn_file.write("\t\tmonitor.export_report()\n\n")
-            
-            mn_file.write("\tinfo('*** Stopping network\\n')\n")
-            mn_file.write("\tnet.stop()\n\n")
-            
-            # Main block
-            mn_file.write("if __name__ == '__main__':\n")
-            mn_file.write("\tsetLogLevel('info')\n")
-            mn_file.write(f"\t{topology.id}_topology()\n")
+        out = []
+        
+        # Write header and imports
+        self._write_header(out, topology)
+        self._write_imports(out, plugin_additions["imports"], enable_monitoring)
+        
+        # Write topology function
+        out.append(f"def {topology_id}_topology():\n\n")
+        out.append("\t'Creates and configures the network topology.'\n")
+        
+        # Pre-network plugin code
+        out.extend(f"\t{line}\n" for line in pre_network)
+        if pre_network:
+            out.append("\n")
+        
+        # Network initialization
+        controller_param = "Controller" if has_controllers else "None"
+        wait_connected_param = "True" if has_controllers else "False"
+        out.append(f"\tnet = Mininet(controller={controller_param}, switch={switch_class}, "
+                   f"link=TCLink, waitConnected={wait_connected_param})\n\n")
+        
+        # Post-network plugin code
+        out.extend(f"\t{line}\n" for line in post_network)
+        if post_network:
+            out.append("\n")
+        
+        # Add standard components
+        self._write_controllers(out, topology)
+        self._write_hosts(out, topology)
+        self._write_switches(out, topology)
+        self._write_links(out, topology)
+        
+        # Add custom components via plugins
+        self._write_custom_components(out, topology)
+        
+        # Start network
+        out.append("\tinfo('*** Starting network\\n')\n")
+        out.append("\tnet.start()\n\n")
+        
+        # Post-start plugin code
+        out.extend(f"\t{line}\n" for line in post_start)
+        if post_start:
+            out.append("\n")
+        
+        # Configure OVS for standalone mode if no controller
+        if not has_controllers:
+            self._write_standalone_config(out, topology)
+        
+        # Add intent monitoring if enabled
+        if enable_monitoring:
+            self._write_intent_monitoring(out, topology)
+        
+        # CLI and cleanup
+        out.append("\tinfo('*** Running CLI\\n')\n")
+        out.append("\tCLI(net)\n\n")
+        
+        # Stop monitoring if enabled
+        if enable_monitoring:
+            out.append("\tinfo('*** Stopping intent monitor\\n')\n")
+            out.append("\tif 'monitor' in locals():\n")
+            out.append("\t\tmonitor.stop_monitoring()\n")
+            out.append("\t\tmonitor.export_report()\n\n")
+        
+        out.append("\tinfo('*** Stopping network\\n')\n")
+        out.append("\tnet.stop()\n\n")
+        
+        # Main block
+        out.append("if __name__ == '__main__':\n")
+        out.append("\tsetLogLevel('info')\n")
+        out.append(f"\t{topology_id}_topology()\n")
+        
+        return "".join(out)
     
-    def _write_header(self, file, topology):
-        file.write(
+    def _write_header(self, out, topology):
+        out.append(
             '"""\n'
             'Mininet script generated automatically.\n'
-            f'Topology: {topology.id.capitalize()}\n'
+            f'Topology: {topology.id_cap}\n'
             f'Version: {topology.version}\n'
             f'Description: {topology.description}\n'
             f'Intent Monitoring: {"Enabled" if topology.enable_monitoring else "Disabled"}\n'
             '"""\n'
         )
     
-    def _write_imports(self, file, additional_imports, enable_monitoring):
-        file.write(
-            "from mininet.net import Mininet\n"
-            "from mininet.node import Controller, RemoteController, OVSKernelSwitch, UserSwitch\n"
-            "from mininet.cli import CLI\n"
-            "from mininet.log import setLogLevel, info\n"
-            "from mininet.link import TCLink\n"
-        )
+    def _write_imports(self, out, additional_imports, enable_monitoring):
+        out.append(_IMPORT_BLOCK)
         
         # Add intent monitoring imports if enabled
         if enable_monitoring:
-            file.write("import json\n")
-            file.write("from intent_monitor import IntentMonitor\n")
+            out.append("import json\n")
+            out.append("from intent_monitor import IntentMonitor\n")
         
         # Add plugin imports
         for import_stmt in additional_imports:
-            file.write(f"{import_stmt}\n")
+            out.append(f"{import_stmt}\n")
         
-        file.write("\n")
+        out.append("\n")
     
-    def _write_intent_monitoring(self, file, topology):
+    def _write_intent_monitoring(self, out, topology):
         """Write intent monitoring setup code."""
-        file.write("\t# Setup intent monitoring\n")
-        file.write("\tinfo('*** Setting up intent monitoring\\n')\n")
+        out.append("\t# Setup intent monitoring\n")
+        out.append("\tinfo('*** Setting up intent monitoring\\n')\n")
         
         # Create topology data for monitor
-        file.write("\ttopology_data = {\n")
-        file.write(f"\t\t'id': '{topology.id}',\n")
-        file.write(f"\t\t'version': '{topology.version}',\n")
-        file.write(f"\t\t'description': '{topology.description}',\n")
-        file.write("\t\t'hosts': [\n")
-        for host in topology.hosts:
-            file.write(f"\t\t\t{host},\n")
-        file.write("\t\t],\n")
-        file.write("\t\t'switches': [\n")
-        for switch in topology.switches:
-            file.write(f"\t\t\t{switch},\n")
-        file.write("\t\t],\n")
-        file.write("\t\t'controllers': [\n")
-        for controller in topology.controllers:
-            file.write(f"\t\t\t{controller},\n")
-        file.write("\t\t],\n")
-        file.write("\t\t'connections': [\n")
-        for conn in topology.connections:
-            file.write(f"\t\t\t{conn},\n")
-        file.write("\t\t]\n")
-        file.write("\t}\n\n")
+        out.append("\ttopology_data = {\n")
+        out.append(f"\t\t'id': '{topology.id}',\n")
+        out.append(f"\t\t'version': '{topology.version}',\n")
+        out.append(f"\t\t'description': '{topology.description}',\n")
+        out.append("\t\t'hosts': [\n")
+        out.extend(f"\t\t\t{host},\n" for host in topology.hosts)
+        out.append("\t\t],\n")
+        out.append("\t\t'switches': [\n")
+        out.extend(f"\t\t\t{switch},\n" for switch in topology.switches)
+        out.append("\t\t],\n")
+        out.append("\t\t'controllers': [\n")
+        out.extend(f"\t\t\t{controller},\n" for controller in topology.controllers)
+        out.append("\t\t],\n")
+        out.append("\t\t'connections': [\n")
+        out.extend(f"\t\t\t{conn},\n" for conn in topology.connections)
+        out.append("\t\t]\n")
+        out.append("\t}\n\n")
         
         # Create topology object for monitor
-        file.write("\tclass TopologyWrapper:\n")
-        file.write("\t\tdef __init__(self, data):\n")
-        file.write("\t\t\tself.__dict__.update(data)\n\n")
+        out.append("\tclass TopologyWrapper:\n")
+        out.append("\t\tdef __init__(self, data):\n")
+        out.append("\t\t\tself.__dict__.update(data)\n\n")
         
-        file.write("\ttopology_wrapper = TopologyWrapper(topology_data)\n")
-        file.write("\tmonitor = IntentMonitor(topology_wrapper, net)\n")
+        out.append("\ttopology_wrapper = TopologyWrapper(topology_data)\n")
+        out.append("\tmonitor = IntentMonitor(topology_wrapper, net)\n")
         
         # Configure monitoring parameters
-        if topology.monitor_interval:
-            file.write(f"\tmonitor.monitor_interval = {topology.monitor_interval}\n")
+        monitor_interval = topology.monitor_interval
+        if monitor_interval:
+            out.append(f"\tmonitor.monitor_interval = {monitor_interval}\n")
         
         if not topology.recovery_enabled:
-            file.write("\tmonitor.recovery_enabled = False\n")
+            out.append("\tmonitor.recovery_enabled = False\n")
         
-        file.write("\tmonitor.start_monitoring()\n\n")
+        out.append("\tmonitor.start_monitoring()\n\n")
     
-    def _write_controllers(self, file, topology):
-        if topology.controllers:
-            file.write(f"\tinfo('*** Adding {len(topology.controllers)} controllers\\n')\n")
-            for controller in topology.controllers:
+    def _write_controllers(self, out, topology):
+        controllers = topology.controllers
+        if controllers:
+            out.append(f"\tinfo('*** Adding {len(controllers)} controllers\\n')\n")
+            for controller in controllers:
                 cid = controller.get('ID', 'c0')
                 ctype = controller.get('TYPE', 'Controller')
                 params = controller.get('PARAMS', {})
@@ -524,126 +790,223 @@ class MininetScriptGenerator:
                 if ctype == 'RemoteController':
                     ip = params.get('IP', '127.0.0.1')
                     port = params.get('PORT', 6653)
-                    file.write(f"\t{cid} = net.addController('{cid}', controller=RemoteController, "
-                             f"ip='{ip}', port={port})\n")
+                    out.append(_ADD_REMOTE_CONTROLLER(cid, ip, port))
                 else:
-                    file.write(f"\t{cid} = net.addController('{cid}')\n")
-            file.write("\n")
+                    out.append(_ADD_CONTROLLER(cid))
+            out.append("\n")
         else:
-            file.write("\tinfo('*** No controller defined. OVS will be configured for standalone mode.\\n')\n\n")
+            out.append("\tinfo('*** No controller defined. OVS will be configured for standalone mode.\\n')\n\n")
     
-    def _write_hosts(self, file, topology):
-        file.write(f"\tinfo('*** Adding {len(topology.hosts)} hosts\\n')\n")
-        for host in topology.hosts:
-            params_list = [f"'{host['id']}'"]
-            if host.get('ip'):
-                params_list.append(f"ip='{host['ip']}'")
-            if host.get('mac'):
-                params_list.append(f"mac='{host['mac']}'")
+    def _write_hosts(self, out, topology):
+        hosts = topology.hosts
+        out.append(f"\tinfo('*** Adding {len(hosts)} hosts\\n')\n")
+        for host in hosts:
+            host_id = host['id']
+            ip = host.get('ip')
+            mac = host.get('mac')
+            head = _HOST_HEAD_TEMPLATES[(bool(ip) << 1) | bool(mac)]
+            params_list = [head.format(id=host_id, ip=ip, mac=mac)]
 
             # Add CPU limit if specified
-            if host.get('max_cpu') is not None:
+            max_cpu = host.get('max_cpu')
+            if max_cpu is not None:
                 try:
                     # Mininet expects CPU as a fraction (e.g., 0.34)
-                    cpu_fraction = float(host['max_cpu'])
+                    cpu_fraction = float(max_cpu)
                     params_list.append(f"cpu={cpu_fraction}")
                 except ValueError:
-                    print(f"Warning: Invalid MAX_CPU value '{host['max_cpu']}' for host {host['id']}. Skipping.")
+                    print(f"Warning: Invalid MAX_CPU value '{max_cpu}' for host {host_id}. Skipping.")
             
-            if host.get('max_ram') is not None:
+            max_ram = host.get('max_ram')
+            if max_ram is not None:
                 try:
                     # Mininet expects RAM as a string with unit (e.g., '100M')
-                    ram_mb = int(host['max_ram'])
+                    ram_mb = int(max_ram)
                     params_list.append(f"mem='{ram_mb}M'")
                 except ValueError:
-                    print(f"Warning: Invalid MAX_RAM value '{host['max_ram']}' for host {host['id']}. Skipping.")
+                    print(f"Warning: Invalid MAX_RAM value '{max_ram}' for host {host_id}. Skipping.")
 
-            for key, value in host.items():
-                if key not in ['id', 'ip', 'mac', 'max_cpu', 'max_ram']: 
-                    if isinstance(value, str):
-                        params_list.append(f"{key}='{value}'")
-                    else:
-                        params_list.append(f"{key}={value}")
+            # repr() quotes strings and leaves numbers and booleans bare
+            params_list.extend(
+                f"{key}={value!r}" for key, value in host.items()
+                if key not in _HOST_SKIP
+            )
             
-            file.write(f"\t{host['id']} = net.addHost({', '.join(params_list)})\n")
-        file.write("\n") 
+            out.append(_ADD_HOST(host_id, ", ".join(params_list)))
+        out.append("\n") 
     
-    def _write_switches(self, file, topology):
-        file.write(f"\tinfo('*** Adding {len(topology.switches)} switches\\n')\n")
-        for switch in topology.switches:
-            sid = switch.get('ID', 's1')
-            file.write(f"\t{sid} = net.addSwitch('{sid}')\n")
-        file.write("\n")
+    def _write_switches(self, out, topology):
+        switches = topology.switches
+        out.append(f"\tinfo('*** Adding {len(switches)} switches\\n')\n")
+        out.extend(_ADD_SWITCH(switch.get('ID', 's1')) for switch in switches)
+        out.append("\n")
     
-    def _write_links(self, file, topology):
-        file.write(f"\tinfo('*** Creating {len(topology.connections)} links\\n')\n")
-        param_map = {'bandwidth': 'bw'}
+    def _write_links(self, out, topology):
+        connections = topology.connections
+        out.append(f"\tinfo('*** Creating {len(connections)} links\\n')\n")
+        param_prefix = _link_param_prefix
+        add_link = _ADD_LINK
         
-        for conn in topology.connections:
+        for conn in connections:
             endpoints = conn.get('ENDPOINTS')
             params = conn.get('PARAMS', {})
             
             if endpoints and len(endpoints) == 2:
-                param_list = []
-                for k, v in params.items():
-                    param_name = param_map.get(k.lower(), k.lower())
-                    if isinstance(v, str):
-                        param_list.append(f"{param_name}='{v}'")
-                    else:
-                        param_list.append(f"{param_name}={v}")
-                
-                link_params_str = ", ".join(param_list)
-                if link_params_str:
-                    file.write(f"\tnet.addLink({endpoints[0]}, {endpoints[1]}, {link_params_str})\n")
-                else:
-                    file.write(f"\tnet.addLink({endpoints[0]}, {endpoints[1]})\n")
-        file.write("\n")
+                # repr() quotes string values and leaves numbers and booleans bare
+                link_params_str = "".join(
+                    f"{param_prefix(k)}{v!r}" for k, v in params.items()
+                )
+                out.append(add_link(endpoints[0], endpoints[1], link_params_str))
+        out.append("\n")
     
-    def _write_custom_components(self, file, topology):
+    def _write_custom_components(self, out, topology):
         """Write custom components using plugins."""
-        for component_type, components in topology.custom_components.items():
-            if component_type in self.plugin_manager.component_plugins:
-                plugin = self.plugin_manager.component_plugins[component_type]
-                
-                file.write(f"\tinfo('*** Adding {len(components)} {component_type}\\n')\n")
+        custom_components = topology.custom_components
+        if not custom_components:
+            return
+        
+        component_plugins = self.plugin_manager.component_plugins
+        for component_type, components in custom_components.items():
+            plugin = component_plugins.get(component_type)
+            if plugin is not None:
+                generate_component_code = plugin.generate_component_code
+                out.append(f"\tinfo('*** Adding {len(components)} {component_type}\\n')\n")
                 for component in components:
-                    code_lines = plugin.generate_component_code(component)
-                    for line in code_lines:
-                        file.write(f"\t{line}\n")
-                file.write("\n")
+                    out.extend(f"\t{line}\n" for line in generate_component_code(component))
+                out.append("\n")
     
-    def _write_standalone_config(self, file, topology):
-        file.write("\tinfo('*** Configuring switches for standalone mode\\n')\n")
-        for switch in topology.switches:
-            sid = switch.get('ID', 's1')
-            file.write(f"\tnet.get('{sid}').cmd('ovs-ofctl add-flow {sid} \"priority=0,actions=normal\"')\n")
-        file.write("\n")
+    def _write_standalone_config(self, out, topology):
+        out.append("\tinfo('*** Configuring switches for standalone mode\\n')\n")
+        out.extend(_STANDALONE_FLOW(switch.get('ID', 's1')) for switch in topology.switches)
+        out.append("\n")
 
 
 # ========================== Utility Functions ==========================
 
+@functools.lru_cache(maxsize=None)
+def _scan_dir(dir_path: Path, mtime_ns: int) -> Tuple[Tuple[str, Path], ...]:
+    """
+    List the files in a directory as sorted (lowercased name, path) pairs.
+    The directory mtime is part of the cache key, so the listing is rebuilt
+    whenever entries are added, removed or renamed.
+    """
+    # DirEntry.is_file() uses the type returned by the directory read, no extra stat
+    with os.scandir(dir_path) as entries:
+        names = sorted(entry.name for entry in entries if entry.is_file())
+    return tuple((name.lower(), dir_path / name) for name in names)
+
+
 def find_matching_file(dir_path: Path, prefix: str) -> Optional[Path]:
     """Find the first file in the directory that starts with the prefix."""
-    files = sorted([f for f in dir_path.iterdir() if f.is_file()])
-    matching_file = next((f for f in files if f.name.lower().startswith(prefix.lower())), None)
+    prefix_lower = prefix.lower()
+    files = _scan_dir(dir_path, dir_path.stat().st_mtime_ns)
+    matching_file = next((f for name, f in files if name.startswith(prefix_lower)), None)
     if matching_file is None:
         raise FileNotFoundError(f"No file found starting with '{prefix}' in {dir_path}")
     return matching_file
 
 
+# Files at least this large are memory-mapped rather than read when orjson is available
+_MMAP_THRESHOLD = 64 * 1024
+
+
 def load_json_file(file_path: Path) -> Dict:
     """Load data from a JSON file."""
-    with open(file_path, 'r', encoding='utf-8') as json_file:
-        return json.load(json_file)
+    file_path = Path(file_path)
+    if orjson is not None:
+        with open(file_path, "rb") as json_file:
+            if os.fstat(json_file.fileno()).st_size >= _MMAP_THRESHOLD:
+                # orjson parses straight from the mapped pages, skipping the copy into bytes
+                with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+            return orjson.loads(json_file.read())
+    # Read the whole file in one call; json accepts UTF-8 bytes directly
+    return json.loads(file_path.read_bytes())
+
+
+def load_topology(file_path: Path, plugin_manager: PluginManager = None) -> Topology:
+    """Load and parse a topology file into a new Topology."""
+    return Topology(load_json_file(file_path), plugin_manager)
 
 
 # ========================== Main Function ==========================
 
+# Plugin manager of a batch worker process, created once by _init_batch_worker
+_batch_plugin_manager: Optional[PluginManager] = None
+
+
+def _init_batch_worker():
+    global _batch_plugin_manager
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    _batch_plugin_manager = PluginManager.get()
+
+
+def _process_one(file_path: Path) -> str:
+    """Load one topology file and generate its Mininet script."""
+    topology = load_topology(file_path, _batch_plugin_manager)
+    output_filename = f"{topology.id}_mn_script.py"
+    MininetScriptGenerator(_batch_plugin_manager).generate(topology, output_filename)
+    return output_filename
+
+
+def _output_id(file_path: Path) -> Optional[str]:
+    """Return the topology ID a file's script is named after, or None if it cannot be read."""
+    try:
+        return load_json_file(file_path).get("ID", "unknown_topology").lower()
+    except Exception:
+        # Left to the worker, which reports the error for this file
+        return None
+
+
+def main_batch(dir_path: Path):
+    """Generate the Mininet scripts for every topology in a directory in parallel."""
+    topology_files = sorted(dir_path.glob("*.json"))
+
+    # Files sharing a topology ID would write the same script concurrently;
+    # none of them is generated and each one is reported instead
+    files_by_id: Dict[str, List[Path]] = {}
+    for topology_file in topology_files:
+        files_by_id.setdefault(_output_id(topology_file), []).append(topology_file)
+    duplicates = {
+        topology_file: (topology_id, files)
+        for topology_id, files in files_by_id.items()
+        if topology_id is not None and len(files) > 1
+        for topology_file in files
+    }
+
+    with ProcessPoolExecutor(initializer=_init_batch_worker) as executor:
+        futures = {
+            f: executor.submit(_process_one, f) for f in topology_files if f not in duplicates
+        }
+        # Report in file order; one bad topology does not stop the others
+        for topology_file in topology_files:
+            if topology_file in duplicates:
+                topology_id, files = duplicates[topology_file]
+                others = ", ".join(f.name for f in files if f != topology_file)
+                print(f"✗ {topology_file.name}: topology ID '{topology_id}' is also used by {others}; skipped.")
+                continue
+            try:
+                print(f"✔ {topology_file.name}: Mininet script '{futures[topology_file].result()}' generated successfully.")
+            except Exception as e:
+                print(f"✗ {topology_file.name}: {e}")
+
+
 def main():
     """Main function to execute the script."""
+    # Show plugin messages on the console the way plain prints did
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    if _validate_topology is None:
+        _log.warning("⚠ fastjsonschema is not installed; topology files will not be validated "
+                     "against the schema (install the 'validation' extra to enable it).")
+    
+    if "--all" in sys.argv[1:]:
+        main_batch(Path() / "topologies")
+        return
+    
     try:
         # Initialize plugin manager
-        plugin_manager = PluginManager()
+        plugin_manager = PluginManager.get()
         
         # Get topology file
         dir_path = Path() / "topologies"
@@ -653,8 +1016,7 @@ def main():
         print(f"Found file: {matching_file}\n")
         
         # Load and parse topology
-        json_data = load_json_file(matching_file)
-        topology = Topology(json_data, plugin_manager)
+        topology = load_topology(matching_file, plugin_manager)
         topology.print_details()
         
         # Generate Mininet script